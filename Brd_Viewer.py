@@ -12,29 +12,38 @@ Further Improved: Added polygon fill for copper pours, added support for circles
 Further Fixed: Corrected mirror transformation to flip over Y-axis (x = -x) instead of X-axis for EAGLE components.
 Further Fixed: Lighten fill color for polygons to make traces visible, expanded bounds to include component shapes.
 Further Fixed: Added _parse_rot to parsers to fix attribute error.
+Further Improved: EAGLE parser streams the XML with iterparse and discards each parsed subtree to cut peak memory on large boards.
 """
 
-import json
+import functools
+import importlib.util
 import math
 import os
 import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import xml.etree.ElementTree as ET
+from array import array
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple, Optional, Union
 
 try:
-    from PIL import Image, ImageDraw
-    PIL_AVAILABLE = True
+    from lxml import etree as LXML_ET
+    LXML_AVAILABLE = True
 except ImportError:
-    PIL_AVAILABLE = False
+    LXML_AVAILABLE = False
+
+XML_PARSE_ERRORS = (ET.ParseError, LXML_ET.XMLSyntaxError) if LXML_AVAILABLE else (ET.ParseError,)
 
 # ------------------------------
 # Data structures
 # ------------------------------
 
-@dataclass
+# Per-shape records are created by the hundred thousand on large boards; slots
+# drop the per-instance __dict__ where the interpreter supports it (3.10+).
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Layer:
     number: int
     name: str
@@ -42,7 +51,7 @@ class Layer:
     visible: bool = True
     active: bool = True
 
-@dataclass
+@dataclass(**_SLOTS)
 class Wire:
     x1: float
     y1: float
@@ -53,7 +62,7 @@ class Wire:
     kind: str = "plain"  # "plain" or "signal"
     net: str = ""
 
-@dataclass
+@dataclass(**_SLOTS)
 class Via:
     x: float
     y: float
@@ -62,7 +71,7 @@ class Via:
     extent: str = ""
     net: str = ""
 
-@dataclass
+@dataclass(**_SLOTS)
 class Pad:
     name: str
     x: float
@@ -75,7 +84,7 @@ class Pad:
     layer: int = 0
     rot: float = 0.0
 
-@dataclass
+@dataclass(**_SLOTS)
 class SMD:
     name: str
     x: float
@@ -86,7 +95,7 @@ class SMD:
     roundness: float = 0.0
     rot: float = 0.0
 
-@dataclass
+@dataclass(**_SLOTS)
 class Circle:
     x: float
     y: float
@@ -94,7 +103,7 @@ class Circle:
     width: float
     layer: int
 
-@dataclass
+@dataclass(**_SLOTS)
 class Rect:
     x1: float
     y1: float
@@ -103,7 +112,7 @@ class Rect:
     layer: int
     rot: float = 0.0
 
-@dataclass
+@dataclass(**_SLOTS)
 class Element:
     name: str
     value: str
@@ -113,7 +122,7 @@ class Element:
     y: float
     rot: str = ""
 
-@dataclass
+@dataclass(**_SLOTS)
 class Polygon:
     vertices: List[Tuple[float, float]]
     layer: int
@@ -121,8 +130,17 @@ class Polygon:
     net: str = ""
     fill: bool = False
     is_outline: bool = False
+    _bbox: Optional[Tuple[float, float, float, float]] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+    def bbox(self) -> Tuple[float, float, float, float]:
+        """(minx, miny, maxx, maxy) of the vertices, computed on first use."""
+        if self._bbox is None:
+            xs = [vx for vx, _ in self.vertices]
+            ys = [vy for _, vy in self.vertices]
+            self._bbox = (min(xs), min(ys), max(xs), max(ys))
+        return self._bbox
+
+@dataclass(**_SLOTS)
 class Text:
     x: float
     y: float
@@ -131,6 +149,96 @@ class Text:
     size: float = 1.0
     rot: float = 0.0
 
+@dataclass
+class WireColumns:
+    """Column (structure-of-arrays) copy of Board.wires for bulk loops."""
+    x1: array = field(default_factory=lambda: array('d'))
+    y1: array = field(default_factory=lambda: array('d'))
+    x2: array = field(default_factory=lambda: array('d'))
+    y2: array = field(default_factory=lambda: array('d'))
+    width: array = field(default_factory=lambda: array('d'))
+    layer: array = field(default_factory=lambda: array('l'))  # EAGLE does not bound layer numbers
+    spans: Dict[int, Tuple[int, int]] = field(default_factory=dict)  # layer -> [start, end) of its contiguous run
+
+@dataclass
+class ViaColumns:
+    """Column copy of Board.vias."""
+    x: array = field(default_factory=lambda: array('d'))
+    y: array = field(default_factory=lambda: array('d'))
+    drill: array = field(default_factory=lambda: array('d'))
+    diameter: array = field(default_factory=lambda: array('d'))
+
+@dataclass
+class PadColumns:
+    """Column copy of Board.pads, laid out layer by layer like WireColumns."""
+    x: array = field(default_factory=lambda: array('d'))
+    y: array = field(default_factory=lambda: array('d'))
+    dx: array = field(default_factory=lambda: array('d'))
+    dy: array = field(default_factory=lambda: array('d'))
+    rot: array = field(default_factory=lambda: array('d'))
+    drill: array = field(default_factory=lambda: array('d'))
+    diameter: array = field(default_factory=lambda: array('d'))
+    shape: List[str] = field(default_factory=list)
+    spans: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+
+@dataclass
+class SmdColumns:
+    """Column copy of Board.smds, laid out layer by layer like WireColumns."""
+    x: array = field(default_factory=lambda: array('d'))
+    y: array = field(default_factory=lambda: array('d'))
+    dx: array = field(default_factory=lambda: array('d'))
+    dy: array = field(default_factory=lambda: array('d'))
+    rot: array = field(default_factory=lambda: array('d'))
+    spans: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+
+# Items whose box covers more grid cells than this are kept in GridIndex.large
+# and returned by every query instead of being registered cell by cell.
+_GRID_MAX_SPAN = 16
+
+@dataclass
+class GridIndex:
+    """Uniform grid over the board: each cell lists the positions (in the
+    indexed list) of the items whose bounding box overlaps it."""
+    x0: float
+    y0: float
+    cell: float
+    cells: Dict[Tuple[int, int], List[int]] = field(default_factory=dict)
+    large: List[int] = field(default_factory=list)
+
+    def insert(self, i: int, x0: float, y0: float, x1: float, y1: float):
+        c = self.cell
+        cx0, cx1 = int((x0 - self.x0) // c), int((x1 - self.x0) // c)
+        cy0, cy1 = int((y0 - self.y0) // c), int((y1 - self.y0) // c)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > _GRID_MAX_SPAN:
+            self.large.append(i)
+            return
+        cells = self.cells
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    bucket = cells[(cx, cy)] = []
+                bucket.append(i)
+
+    def query(self, x0: float, y0: float, x1: float, y1: float) -> List[int]:
+        """Positions of the items that may overlap the box, in list order."""
+        c = self.cell
+        cx0, cx1 = int((x0 - self.x0) // c), int((x1 - self.x0) // c)
+        cy0, cy1 = int((y0 - self.y0) // c), int((y1 - self.y0) // c)
+        hits = set(self.large)
+        cells = self.cells
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(cells):
+            for (cx, cy), bucket in cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    hits.update(bucket)
+        else:
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        hits.update(bucket)
+        return sorted(hits)
+
 @dataclass
 class Board:
     layers: Dict[int, Layer] = field(default_factory=dict)
@@ -142,7 +250,235 @@ class Board:
     polygons: List[Polygon] = field(default_factory=list)
     texts: List[Text] = field(default_factory=list)
     packages: Dict[str, List[Union[Wire, Pad, SMD, Circle, Rect, Polygon]]] = field(default_factory=dict)  # Package shapes
+    package_hull: Dict[str, List[Tuple[float, float]]] = field(default_factory=dict)  # Convex hull of each package's shape points
     bounds: Optional[Tuple[float, float, float, float]] = None
+    wire_cols: WireColumns = field(default_factory=WireColumns)
+    via_cols: ViaColumns = field(default_factory=ViaColumns)
+    pad_cols: PadColumns = field(default_factory=PadColumns)
+    smd_cols: SmdColumns = field(default_factory=SmdColumns)
+    wires_by_layer: Dict[int, List[Wire]] = field(default_factory=dict)
+    pads_by_layer: Dict[int, List[Pad]] = field(default_factory=dict)
+    smds_by_layer: Dict[int, List[SMD]] = field(default_factory=dict)
+    polygons_by_layer: Dict[int, List[Polygon]] = field(default_factory=dict)
+    texts_by_layer: Dict[int, List[Text]] = field(default_factory=dict)
+    net_index: Dict[str, Tuple[List[int], List[int], List[int]]] = field(default_factory=dict)  # net -> (wire, via, polygon) indices
+    layer_grids: Dict[str, Dict[int, GridIndex]] = field(default_factory=dict)  # 'wires'/'pads'/... -> layer -> index into *_by_layer
+    via_grid: Optional[GridIndex] = None  # index into vias
+
+    def build_layer_buckets(self):
+        """Group the flat shape lists by layer so render loops only visit visible layers."""
+        for items, buckets in ((self.wires, self.wires_by_layer), (self.pads, self.pads_by_layer),
+                               (self.smds, self.smds_by_layer), (self.polygons, self.polygons_by_layer),
+                               (self.texts, self.texts_by_layer)):
+            buckets.clear()
+            for item in items:
+                bucket = buckets.get(item.layer)
+                if bucket is None:
+                    bucket = buckets[item.layer] = []
+                bucket.append(item)
+
+    def build_grid_index(self, cells_per_side: int = 64):
+        """Spatially index the per-layer buckets and the vias on a uniform grid
+        over the board bounds, so zoomed-in redraws only visit nearby items."""
+        minx, miny, maxx, maxy = self.bounds or (0.0, 0.0, 100.0, 100.0)
+        cell = max(maxx - minx, maxy - miny, 1e-6) / cells_per_side
+
+        def index(items, box) -> GridIndex:
+            grid = GridIndex(minx, miny, cell)
+            for i, item in enumerate(items):
+                grid.insert(i, *box(item))
+            return grid
+
+        def wire_box(w):
+            m = w.width / 2
+            return min(w.x1, w.x2) - m, min(w.y1, w.y2) - m, max(w.x1, w.x2) + m, max(w.y1, w.y2) + m
+
+        def pad_box(p):
+            m = _pad_reach(p)
+            return p.x - m, p.y - m, p.x + m, p.y + m
+
+        def smd_box(s):
+            m = max(s.dx, s.dy) * 0.75
+            return s.x - m, s.y - m, s.x + m, s.y + m
+
+        def polygon_box(p):
+            x0, y0, x1, y1 = p.bbox()
+            m = p.width / 2
+            return x0 - m, y0 - m, x1 + m, y1 + m
+
+        def text_box(t):
+            m = t.size * max(len(t.text), 1)
+            return t.x - m, t.y - m, t.x + m, t.y + m
+
+        def via_box(v):
+            m = max(v.diameter, v.drill) / 2
+            return v.x - m, v.y - m, v.x + m, v.y + m
+
+        self.layer_grids = {
+            kind: {layer: index(items, box) for layer, items in buckets.items()}
+            for kind, buckets, box in (('wires', self.wires_by_layer, wire_box), ('pads', self.pads_by_layer, pad_box),
+                                       ('smds', self.smds_by_layer, smd_box), ('polygons', self.polygons_by_layer, polygon_box),
+                                       ('texts', self.texts_by_layer, text_box))
+        }
+        self.via_grid = index(self.vias, via_box)
+
+    def build_net_index(self):
+        """Map each net name to the indices of its wires, vias and polygons for O(net size) highlighting."""
+        index = self.net_index
+        index.clear()
+        for slot, items in enumerate((self.wires, self.vias, self.polygons)):
+            for i, item in enumerate(items):
+                if item.net:
+                    ids = index.get(item.net)
+                    if ids is None:
+                        ids = index[item.net] = ([], [], [])
+                    ids[slot].append(i)
+
+    def build_columns(self):
+        """Fill the column copies of wires, vias, pads and SMDs once parsing is complete; everything but vias is laid out layer by layer."""
+        wc = self.wire_cols = WireColumns()
+        wires = self._layer_ordered(self.wires_by_layer, wc.spans)
+        wc.x1.extend(w.x1 for w in wires)
+        wc.y1.extend(w.y1 for w in wires)
+        wc.x2.extend(w.x2 for w in wires)
+        wc.y2.extend(w.y2 for w in wires)
+        wc.width.extend(w.width for w in wires)
+        wc.layer.extend(w.layer for w in wires)
+        vias = self.vias
+        vc = self.via_cols = ViaColumns()
+        vc.x.extend(v.x for v in vias)
+        vc.y.extend(v.y for v in vias)
+        vc.drill.extend(v.drill for v in vias)
+        vc.diameter.extend(v.diameter for v in vias)
+        pc = self.pad_cols = PadColumns()
+        pads = self._layer_ordered(self.pads_by_layer, pc.spans)
+        pc.x.extend(p.x for p in pads)
+        pc.y.extend(p.y for p in pads)
+        pc.dx.extend(p.dx for p in pads)
+        pc.dy.extend(p.dy for p in pads)
+        pc.rot.extend(p.rot for p in pads)
+        pc.drill.extend(p.drill for p in pads)
+        pc.diameter.extend(p.diameter for p in pads)
+        pc.shape.extend(p.shape for p in pads)
+        sc = self.smd_cols = SmdColumns()
+        smds = self._layer_ordered(self.smds_by_layer, sc.spans)
+        sc.x.extend(s.x for s in smds)
+        sc.y.extend(s.y for s in smds)
+        sc.dx.extend(s.dx for s in smds)
+        sc.dy.extend(s.dy for s in smds)
+        sc.rot.extend(s.rot for s in smds)
+
+    @staticmethod
+    def _layer_ordered(buckets: Dict[int, list], spans: Dict[int, Tuple[int, int]]) -> list:
+        """Concatenate per-layer buckets in layer order, recording each layer's [start, end) in spans."""
+        items = []
+        for layer in sorted(buckets):
+            bucket = buckets[layer]
+            spans[layer] = (len(items), len(items) + len(bucket))
+            items += bucket
+        return items
+
+# ------------------------------
+# Geometry helpers
+# ------------------------------
+
+# EAGLE rotation attributes come from a tiny vocabulary, so parsed values are
+# looked up before falling back to string handling. _ROT_CACHE holds element
+# rotations (mirrored ones negated); _SHAPE_ROT_CACHE holds the plain angle
+# used for pads, SMDs, rectangles and texts.
+_ROT_CACHE: Dict[str, float] = {
+    "": 0.0, "R0": 0.0, "R90": 90.0, "R180": 180.0, "R270": 270.0,
+    "MR0": -0.0, "MR90": -90.0, "MR180": -180.0, "MR270": -270.0,
+}
+_SHAPE_ROT_CACHE: Dict[str, float] = {"R0": 0.0, "R90": 90.0, "R180": 180.0, "R270": 270.0}
+
+def _parse_rot(rot_str: str) -> float:
+    rot = _ROT_CACHE.get(rot_str)
+    if rot is not None:
+        return rot
+    mirror = rot_str[0] == 'M'
+    angle_str = rot_str.lstrip('M')
+    rot = float(angle_str.lstrip('R')) if angle_str else 0.0
+    if mirror:
+        rot = -rot
+    _ROT_CACHE[rot_str] = rot
+    return rot
+
+def _shape_rot(rot_str: str) -> float:
+    rot = _SHAPE_ROT_CACHE.get(rot_str)
+    if rot is None:
+        rot = _SHAPE_ROT_CACHE[rot_str] = float(rot_str.lstrip('R').lstrip('M'))
+    return rot
+
+# EAGLE rotations are nearly always multiples of 90 or 45 degrees, so a small
+# cache answers almost every (sin, cos) lookup without touching math.
+@functools.lru_cache(maxsize=512)
+def _sincos(deg: float) -> Tuple[float, float]:
+    angle = math.radians(deg)
+    return math.sin(angle), math.cos(angle)
+
+def _box_corners(hw: float, hh: float, s: float, c: float) -> Tuple[Tuple[float, float], ...]:
+    """Corners of a 2*hw x 2*hh box rotated by the angle whose sine/cosine are (s, c)."""
+    # Opposite corners are point reflections of each other, so two rotated
+    # half-diagonals are enough.
+    dx1 = hw * c - hh * s
+    dy1 = hw * s + hh * c
+    dx2 = hw * c + hh * s
+    dy2 = hw * s - hh * c
+    return ((dx1, dy1), (dx2, dy2), (-dx1, -dy1), (-dx2, -dy2))
+
+# A board repeats the same few pad/SMD sizes and rotations thousands of times;
+# shapes with equal geometry share one corner tuple, computed once.
+@functools.lru_cache(maxsize=4096)
+def _footprint_corners(dx: float, dy: float, rot: float) -> Tuple[Tuple[float, float], ...]:
+    return _box_corners(dx / 2, dy / 2, *_sincos(rot))
+
+def _pad_reach(p: Pad) -> float:
+    """Half-size of a square about the pad centre that holds its copper (at
+    any rotation) and its drill; a mounting hole may have no copper at all."""
+    return max(p.diameter, p.dx, p.dy, p.drill, 0.1) * 0.75
+
+def _rotated_extent(pts, c: float, s: float, mirror: bool) -> Optional[Tuple[float, float, float, float]]:
+    """Bounding box of pts after mirroring (x -> -x) and rotating by (c, s), in one pass."""
+    if not pts:
+        return None
+    ms = -1.0 if mirror else 1.0
+    x_min = y_min = math.inf
+    x_max = y_max = -math.inf
+    for px, py in pts:
+        px *= ms
+        x = px * c - py * s
+        y = px * s + py * c
+        if x < x_min:
+            x_min = x
+        if x > x_max:
+            x_max = x
+        if y < y_min:
+            y_min = y
+        if y > y_max:
+            y_max = y
+    return x_min, y_min, x_max, y_max
+
+def _convex_hull(pts) -> List[Tuple[float, float]]:
+    """Convex hull of pts (monotone chain). Rotating the hull gives the same box as rotating every point."""
+    pts = sorted(set(pts))
+    if len(pts) <= 2:
+        return pts
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower: List[Tuple[float, float]] = []
+    for p in pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper: List[Tuple[float, float]] = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
 
 # ------------------------------
 # Parser for EAGLE XML .brd
@@ -150,233 +486,256 @@ class Board:
 class EagleParser:
     def __init__(self, path: str):
         self.path = path
-        self.tree = None
-        self.root = None
         self.board = Board()
 
     def parse(self) -> Board:
+        # Stream the file and flatten each top-level item as soon as its end tag
+        # is seen, then drop it from its parent so the tree never grows past the
+        # current nesting depth.
+        seen_drawing = False
+        seen_board = False
+        stack = []
+        # Shapes are collected per section and joined below in the order the
+        # sections were always read in (libraries, plain, signals), so the
+        # drawing and export z-order does not depend on the order of the file.
+        board = self.board
+        staged = {'packages': Board(), 'plain': Board(), 'signals': Board()}
         try:
-            self.tree = ET.parse(self.path)
-            self.root = self.tree.getroot()
-        except ET.ParseError as e:
+            if LXML_AVAILABLE:
+                events = LXML_ET.iterparse(self.path, events=("start", "end"), huge_tree=True)
+            else:
+                events = ET.iterparse(self.path, events=("start", "end"))
+            for event, elem in events:
+                if event == "start":
+                    if elem.tag == 'drawing' and len(stack) == 1:
+                        seen_drawing = True
+                    elif elem.tag == 'board' and seen_drawing:
+                        seen_board = True
+                    stack.append(elem)
+                    continue
+                stack.pop()
+                if not stack:
+                    break
+                parent = stack[-1]
+                ptag = parent.tag
+                tag = elem.tag
+                if ptag == 'layers' and tag == 'layer':
+                    self._parse_layer(elem)
+                elif ptag == 'packages' and tag == 'package':
+                    self.board = staged['packages']
+                    self._parse_package(elem)
+                elif ptag == 'plain':
+                    self.board = staged['plain']
+                    self._parse_plain_item(elem)
+                elif ptag == 'elements' and tag == 'element':
+                    self._parse_element(elem)
+                elif ptag == 'signals' and tag == 'signal':
+                    self.board = staged['signals']
+                    self._parse_signal(elem)
+                else:
+                    continue
+                self.board = board
+                elem.clear()
+                parent.remove(elem)
+        except XML_PARSE_ERRORS as e:
             raise RuntimeError(f"XML parse error: {e}")
         except Exception as e:
             raise RuntimeError(f"Failed to open file: {e}")
+        finally:
+            self.board = board
 
-        drawing = self.root.find('drawing')
-        if drawing is None:
+        if not seen_drawing:
             raise RuntimeError("Not an EAGLE XML file (missing <drawing> root)")
-        brd = drawing.find('board')
-        if brd is None:
+        if not seen_board:
             raise RuntimeError("Not a board file (missing <board> element)")
 
-        self._parse_layers(drawing)
-        self._parse_libraries(brd)  # Parse packages from libraries
-        self._parse_plain(brd)
-        self._parse_elements(brd)
-        self._parse_signals(brd)
+        board.packages.update(staged['packages'].packages)
+        board.package_hull.update(staged['packages'].package_hull)
+        for name in ('wires', 'vias', 'pads', 'smds', 'polygons', 'texts'):
+            setattr(board, name, [item for section in staged.values() for item in getattr(section, name)])
+        self.board.build_layer_buckets()
+        self.board.build_columns()
+        self.board.build_net_index()
         self._compute_bounds()
+        self.board.build_grid_index()
         return self.board
 
-    def _parse_layers(self, drawing):
-        layers = drawing.find('layers')
-        if layers is None:
-            return
-        for l in layers.findall('layer'):
-            try:
-                num = int(l.get('number', '0'))
-                name = l.get('name', f"L{num}")
-                color = int(l.get('color', '7'))
-                visible = l.get('visible', 'yes') == 'yes'
-                active = l.get('active', 'yes') == 'yes'
-                self.board.layers[num] = Layer(number=num, name=name, color=color, visible=visible, active=active)
-            except Exception:
-                continue
-
-    def _parse_libraries(self, brd):
-        libraries = brd.find('libraries')
-        if libraries is None:
-            return
-        for lib in libraries.findall('library'):
-            packages = lib.find('packages')
-            if packages is None:
-                continue
-            for pkg in packages.findall('package'):
-                pkg_name = pkg.get('name', '')
-                shapes = []
-                for w in pkg.findall('wire'):
-                    w_obj = self._add_wire_from_xml(w, kind="package")
-                    if w_obj:
-                        shapes.append(w_obj)
-                for pad in pkg.findall('pad'):
-                    pad_obj = self._add_pad_from_xml(pad)
-                    if pad_obj:
-                        shapes.append(pad_obj)
-                for smd in pkg.findall('smd'):
-                    smd_obj = self._add_smd_from_xml(smd)
-                    if smd_obj:
-                        shapes.append(smd_obj)
-                for c in pkg.findall('circle'):
-                    c_obj = self._add_circle_from_xml(c)
-                    if c_obj:
-                        shapes.append(c_obj)
-                for r in pkg.findall('rectangle'):
-                    r_obj = self._add_rect_from_xml(r)
-                    if r_obj:
-                        shapes.append(r_obj)
-                for poly in pkg.findall('polygon'):
-                    p_obj = self._add_polygon_from_xml(poly, net="", in_package=True)
-                    if p_obj:
-                        shapes.append(p_obj)
-                self.board.packages[pkg_name] = shapes
-
-    def _parse_plain(self, brd):
-        plain = brd.find('plain')
-        if plain is None:
-            return
-        for w in plain.findall('wire'):
-            self._add_wire_from_xml(w, kind="plain")
-        for p in plain.findall('pad'):
-            self._add_pad_from_xml(p)
-        for s in plain.findall('smd'):
-            self._add_smd_from_xml(s)
-        for poly in plain.findall('polygon'):
-            self._add_polygon_from_xml(poly, net="")
-        for text in plain.findall('text'):
-            self._add_text_from_xml(text)
-
-    def _parse_elements(self, brd):
-        elements = brd.find('elements')
-        if elements is None:
-            return
-        for e in elements.findall('element'):
-            try:
-                name = e.get('name', '')
-                value = e.get('value', '')
-                library = e.get('library', '')
-                package = e.get('package', '')
-                x = float(e.get('x', '0'))
-                y = float(e.get('y', '0'))
-                rot = e.get('rot', '')
-                self.board.elements.append(Element(name=name, value=value, library=library, package=package, x=x, y=y, rot=rot))
-            except Exception:
-                continue
+    def _parse_layer(self, l):
+        try:
+            num = int(l.get('number', '0'))
+            name = l.get('name', f"L{num}")
+            color = int(l.get('color', '7'))
+            visible = l.get('visible', 'yes') == 'yes'
+            active = l.get('active', 'yes') == 'yes'
+            self.board.layers[num] = Layer(number=num, name=name, color=color, visible=visible, active=active)
+        except ValueError:
+            pass
 
-    def _parse_signals(self, brd):
-        signals = brd.find('signals')
-        if signals is None:
-            return
-        for s in signals.findall('signal'):
-            name = s.get('name', '')
-            for w in s.findall('wire'):
-                w_obj = self._add_wire_from_xml(w, kind="signal")
-                if w_obj:
-                    w_obj.net = name
-            for v in s.findall('via'):
-                self._add_via_from_xml(v, name)
-            for poly in s.findall('polygon'):
-                self._add_polygon_from_xml(poly, net=name)
+    def _parse_package(self, pkg):
+        # Each loop knows its shape kind, so the outline points used for the
+        # bounds hull are collected here instead of by a type switch later.
+        pkg_name = sys.intern(pkg.get('name', ''))
+        shapes = []
+        pts = []
+        for w in pkg.findall('wire'):
+            w_obj = self._add_wire_from_xml(w, kind="package")
+            if w_obj:
+                shapes.append(w_obj)
+                pts += ((w_obj.x1, w_obj.y1), (w_obj.x2, w_obj.y2))
+        for pad in pkg.findall('pad'):
+            pad_obj = self._add_pad_from_xml(pad)
+            if pad_obj:
+                shapes.append(pad_obj)
+                pts.append((pad_obj.x, pad_obj.y))
+        for smd in pkg.findall('smd'):
+            smd_obj = self._add_smd_from_xml(smd)
+            if smd_obj:
+                shapes.append(smd_obj)
+                pts.append((smd_obj.x, smd_obj.y))
+        for c in pkg.findall('circle'):
+            c_obj = self._add_circle_from_xml(c)
+            if c_obj:
+                shapes.append(c_obj)
+                pts.append((c_obj.x, c_obj.y))
+        for r in pkg.findall('rectangle'):
+            r_obj = self._add_rect_from_xml(r)
+            if r_obj:
+                shapes.append(r_obj)
+                pts += ((r_obj.x1, r_obj.y1), (r_obj.x1, r_obj.y2), (r_obj.x2, r_obj.y1), (r_obj.x2, r_obj.y2))
+        for poly in pkg.findall('polygon'):
+            p_obj = self._add_polygon_from_xml(poly, net="", in_package=True)
+            if p_obj:
+                shapes.append(p_obj)
+                pts += p_obj.vertices
+        self.board.packages[pkg_name] = shapes
+        self.board.package_hull[pkg_name] = _convex_hull(pts)
+
+    def _parse_plain_item(self, el):
+        tag = el.tag
+        if tag == 'wire':
+            self._add_wire_from_xml(el, kind="plain")
+        elif tag == 'pad':
+            self._add_pad_from_xml(el)
+        elif tag == 'smd':
+            self._add_smd_from_xml(el)
+        elif tag == 'polygon':
+            self._add_polygon_from_xml(el, net="")
+        elif tag == 'text':
+            self._add_text_from_xml(el)
+
+    def _parse_element(self, e):
+        try:
+            name = e.get('name', '')
+            value = e.get('value', '')
+            library = sys.intern(e.get('library', ''))
+            package = sys.intern(e.get('package', ''))
+            x = float(e.get('x', '0'))
+            y = float(e.get('y', '0'))
+            rot = e.get('rot', '')
+            self.board.elements.append(Element(name=name, value=value, library=library, package=package, x=x, y=y, rot=rot))
+        except ValueError:
+            pass
 
+    def _parse_signal(self, s):
+        # Interned so every wire/via/polygon on the net shares one string and
+        # net comparisons and dict lookups short-circuit on identity.
+        name = sys.intern(s.get('name', ''))
+        for w in s.findall('wire'):
+            w_obj = self._add_wire_from_xml(w, kind="signal")
+            if w_obj:
+                w_obj.net = name
+        for v in s.findall('via'):
+            self._add_via_from_xml(v, name)
+        for poly in s.findall('polygon'):
+            self._add_polygon_from_xml(poly, net=name)
+
+    # The shape helpers skip an item only when one of its numeric attributes
+    # (or a rotation they cannot read) fails to convert; anything else is a
+    # bug and surfaces through parse() instead of silently dropping shapes.
     def _add_wire_from_xml(self, w_el, kind: str) -> Optional[Wire]:
         try:
-            x1 = float(w_el.get('x1', '0'))
-            y1 = float(w_el.get('y1', '0'))
-            x2 = float(w_el.get('x2', '0'))
-            y2 = float(w_el.get('y2', '0'))
-            width = float(w_el.get('width', '0.1'))
-            layer = int(w_el.get('layer', '0'))
-            w = Wire(x1=x1, y1=y1, x2=x2, y2=y2, width=width, layer=layer, kind=kind)
+            g = w_el.attrib.get
+            flt = float
+            w = Wire(x1=flt(g('x1', '0')), y1=flt(g('y1', '0')), x2=flt(g('x2', '0')), y2=flt(g('y2', '0')),
+                     width=flt(g('width', '0.1')), layer=int(g('layer', '0')), kind=kind)
             self.board.wires.append(w)
             return w
-        except Exception:
+        except ValueError:
             pass
         return None
 
     def _add_via_from_xml(self, v_el, net: str):
         try:
-            x = float(v_el.get('x', '0'))
-            y = float(v_el.get('y', '0'))
-            drill = float(v_el.get('drill', '0'))
-            diameter = float(v_el.get('diameter', '0')) if v_el.get('diameter') else 0.0
-            extent = v_el.get('extent', '')
-            v = Via(x=x, y=y, drill=drill, diameter=diameter, extent=extent, net=net)
+            g = v_el.attrib.get
+            flt = float
+            diameter = g('diameter')
+            v = Via(x=flt(g('x', '0')), y=flt(g('y', '0')), drill=flt(g('drill', '0')),
+                    diameter=flt(diameter) if diameter else 0.0, extent=g('extent', ''), net=net)
             self.board.vias.append(v)
-        except Exception:
+        except ValueError:
             pass
 
     def _add_pad_from_xml(self, p_el) -> Optional[Pad]:
         try:
-            name = p_el.get('name', '')
-            x = float(p_el.get('x', '0'))
-            y = float(p_el.get('y', '0'))
-            drill = float(p_el.get('drill', '0'))
-            diameter = float(p_el.get('diameter', '0'))
-            shape = p_el.get('shape', 'round')
-            layer = int(p_el.get('layer', '0'))
-            rot_str = p_el.get('rot', 'R0')
-            rot = float(rot_str.lstrip('R').lstrip('M'))
+            g = p_el.attrib.get
+            flt = float
+            diameter = flt(g('diameter', '0'))
+            shape = g('shape', 'round')
+            rot = _shape_rot(g('rot', 'R0'))
             dx = diameter if shape != 'round' else 0.0
-            dy = diameter if shape != 'round' else 0.0
-            p = Pad(name=name, x=x, y=y, drill=drill, diameter=diameter, dx=dx, dy=dy, shape=shape, layer=layer, rot=rot)
+            p = Pad(name=g('name', ''), x=flt(g('x', '0')), y=flt(g('y', '0')), drill=flt(g('drill', '0')),
+                    diameter=diameter, dx=dx, dy=dx, shape=shape, layer=int(g('layer', '0')), rot=rot)
             self.board.pads.append(p)
             return p
-        except Exception:
+        except ValueError:
             pass
         return None
 
     def _add_smd_from_xml(self, s_el) -> Optional[SMD]:
         try:
-            name = s_el.get('name', '')
-            x = float(s_el.get('x', '0'))
-            y = float(s_el.get('y', '0'))
-            dx = float(s_el.get('dx', '0'))
-            dy = float(s_el.get('dy', '0'))
-            layer = int(s_el.get('layer', '0'))
-            roundness = float(s_el.get('roundness', '0'))
-            rot_str = s_el.get('rot', 'R0')
-            rot = float(rot_str.lstrip('R').lstrip('M'))
-            s = SMD(name=name, x=x, y=y, dx=dx, dy=dy, layer=layer, roundness=roundness, rot=rot)
+            g = s_el.attrib.get
+            flt = float
+            rot = _shape_rot(g('rot', 'R0'))
+            s = SMD(name=g('name', ''), x=flt(g('x', '0')), y=flt(g('y', '0')), dx=flt(g('dx', '0')), dy=flt(g('dy', '0')),
+                    layer=int(g('layer', '0')), roundness=flt(g('roundness', '0')), rot=rot)
             self.board.smds.append(s)
             return s
-        except Exception:
+        except ValueError:
             pass
         return None
 
     def _add_circle_from_xml(self, c_el) -> Optional[Circle]:
         try:
-            x = float(c_el.get('x', '0'))
-            y = float(c_el.get('y', '0'))
-            radius = float(c_el.get('radius', '0'))
-            width = float(c_el.get('width', '0.1'))
-            layer = int(c_el.get('layer', '0'))
-            return Circle(x=x, y=y, radius=radius, width=width, layer=layer)
-        except Exception:
+            g = c_el.attrib.get
+            flt = float
+            return Circle(x=flt(g('x', '0')), y=flt(g('y', '0')), radius=flt(g('radius', '0')),
+                          width=flt(g('width', '0.1')), layer=int(g('layer', '0')))
+        except ValueError:
             pass
         return None
 
     def _add_rect_from_xml(self, r_el) -> Optional[Rect]:
         try:
-            x1 = float(r_el.get('x1', '0'))
-            y1 = float(r_el.get('y1', '0'))
-            x2 = float(r_el.get('x2', '0'))
-            y2 = float(r_el.get('y2', '0'))
-            layer = int(r_el.get('layer', '0'))
-            rot_str = r_el.get('rot', 'R0')
-            rot = float(rot_str.lstrip('R').lstrip('M'))
-            return Rect(x1=x1, y1=y1, x2=x2, y2=y2, layer=layer, rot=rot)
-        except Exception:
+            g = r_el.attrib.get
+            flt = float
+            rot = _shape_rot(g('rot', 'R0'))
+            return Rect(x1=flt(g('x1', '0')), y1=flt(g('y1', '0')), x2=flt(g('x2', '0')), y2=flt(g('y2', '0')),
+                        layer=int(g('layer', '0')), rot=rot)
+        except ValueError:
             pass
         return None
 
     def _add_polygon_from_xml(self, p_el, net: str, in_package: bool = False) -> Optional[Polygon]:
         try:
-            layer = int(p_el.get('layer', '0'))
-            width = float(p_el.get('width', '0.1'))
+            g = p_el.attrib.get
+            flt = float
+            layer = int(g('layer', '0'))
+            width = flt(g('width', '0.1'))
             verts = []
+            append = verts.append
             for v in p_el.findall('vertex'):
-                vx = float(v.get('x', '0'))
-                vy = float(v.get('y', '0'))
-                verts.append((vx, vy))
+                vg = v.attrib.get
+                append((flt(vg('x', '0')), flt(vg('y', '0'))))
             if len(verts) > 2:
                 is_outline = (layer == 20)
                 fill = (net != "") and not is_outline
@@ -386,116 +745,159 @@ class EagleParser:
                 else:
                     self.board.polygons.append(p)
                     return p
-        except Exception:
+        except ValueError:
             pass
         return None
 
     def _add_text_from_xml(self, t_el):
         try:
-            x = float(t_el.get('x', '0'))
-            y = float(t_el.get('y', '0'))
-            layer = int(t_el.get('layer', '0'))
-            size = float(t_el.get('size', '1.27'))
-            rot_str = t_el.get('rot', 'R0')
-            rot = float(rot_str.lstrip('R').lstrip('M'))
-            text = t_el.text or ''
-            self.board.texts.append(Text(x=x, y=y, text=text, layer=layer, size=size, rot=rot))
-        except Exception:
+            g = t_el.attrib.get
+            flt = float
+            rot = _shape_rot(g('rot', 'R0'))
+            self.board.texts.append(Text(x=flt(g('x', '0')), y=flt(g('y', '0')), text=t_el.text or '',
+                                         layer=int(g('layer', '0')), size=flt(g('size', '1.27')), rot=rot))
+        except ValueError:
             pass
 
-    def _parse_rot(self, rot_str: str) -> float:
-        if not rot_str:
-            return 0.0
-        mirror = rot_str[0] == 'M'
-        rot_str = rot_str.lstrip('M')
-        rot = float(rot_str.lstrip('R')) if rot_str else 0.0
-        if mirror:
-            rot = -rot
-        return rot
-
     def _compute_bounds(self):
-        xs, ys = [], []
-        for w in self.board.wires:
-            xs += [w.x1, w.x2]
-            ys += [w.y1, w.y2]
-        for v in self.board.vias:
-            xs.append(v.x)
-            ys.append(v.y)
-        for p in self.board.pads:
-            xs.append(p.x)
-            ys.append(p.y)
-        for s in self.board.smds:
-            xs.append(s.x)
-            ys.append(s.y)
-        for e in self.board.elements:
-            xs.append(e.x)
-            ys.append(e.y)
-            package_shapes = self.board.packages.get(e.package, [])
-            angle = math.radians(self._parse_rot(e.rot))
-            mirror = 'M' in e.rot
-            for shape in package_shapes:
-                if isinstance(shape, Wire):
-                    rx1 = shape.x1 if not mirror else -shape.x1
-                    ry1 = shape.y1
-                    rx1_rot = rx1 * math.cos(angle) - ry1 * math.sin(angle)
-                    ry1_rot = rx1 * math.sin(angle) + ry1 * math.cos(angle)
-                    abs_x1 = e.x + rx1_rot
-                    abs_y1 = e.y + ry1_rot
-
-                    rx2 = shape.x2 if not mirror else -shape.x2
-                    ry2 = shape.y2
-                    rx2_rot = rx2 * math.cos(angle) - ry2 * math.sin(angle)
-                    ry2_rot = rx2 * math.sin(angle) + ry2 * math.cos(angle)
-                    abs_x2 = e.x + rx2_rot
-                    abs_y2 = e.y + ry2_rot
-
-                    xs += [abs_x1, abs_x2]
-                    ys += [abs_y1, abs_y2]
-                elif isinstance(shape, (Pad, SMD, Circle)):
-                    rx = shape.x if not mirror else -shape.x
-                    ry = shape.y
-                    rx_rot = rx * math.cos(angle) - ry * math.sin(angle)
-                    ry_rot = rx * math.sin(angle) + ry * math.cos(angle)
-                    abs_x = e.x + rx_rot
-                    abs_y = e.y + ry_rot
-                    xs.append(abs_x)
-                    ys.append(abs_y)
-                elif isinstance(shape, Rect):
-                    x1 = shape.x1 if not mirror else -shape.x1
-                    y1 = shape.y1
-                    x2 = shape.x2 if not mirror else -shape.x2
-                    y2 = shape.y2
-                    xs_rel = [x1, x2]
-                    ys_rel = [y1, y2]
-                    for rx, ry in [(min(xs_rel), min(ys_rel)), (min(xs_rel), max(ys_rel)), (max(xs_rel), min(ys_rel)), (max(xs_rel), max(ys_rel))]:
-                        rx_rot = rx * math.cos(angle) - ry * math.sin(angle)
-                        ry_rot = rx * math.sin(angle) + ry * math.cos(angle)
-                        abs_x = e.x + rx_rot
-                        abs_y = e.y + ry_rot
-                        xs.append(abs_x)
-                        ys.append(abs_y)
-                elif isinstance(shape, Polygon):
-                    for vx, vy in shape.vertices:
-                        rx = vx if not mirror else -vx
-                        ry = vy
-                        rx_rot = rx * math.cos(angle) - ry * math.sin(angle)
-                        ry_rot = rx * math.sin(angle) + ry * math.cos(angle)
-                        abs_x = e.x + rx_rot
-                        abs_y = e.y + ry_rot
-                        xs.append(abs_x)
-                        ys.append(abs_y)
-        for poly in self.board.polygons:
-            for vx, vy in poly.vertices:
-                xs.append(vx)
-                ys.append(vy)
+        board = self.board
+        xs = [w.x1 for w in board.wires] + [w.x2 for w in board.wires]
+        ys = [w.y1 for w in board.wires] + [w.y2 for w in board.wires]
+        for items in (board.vias, board.pads, board.smds, board.elements):
+            xs += [it.x for it in items]
+            ys += [it.y for it in items]
+        # Each package is reduced to its convex hull at parse time, and the rotated
+        # extent of that hull is computed once per (package, rotation); each
+        # element then only offsets a cached box by its position.
+        extents: Dict[Tuple[str, str], Optional[Tuple[float, float, float, float]]] = {}
+        for e in board.elements:
+            key = (e.package, e.rot)
+            if key in extents:
+                ext = extents[key]
+            else:
+                sin_a, cos_a = _sincos(_parse_rot(e.rot))
+                hull = board.package_hull.get(e.package, [])
+                ext = extents[key] = _rotated_extent(hull, cos_a, sin_a, 'M' in e.rot)
+            if ext is None:
+                continue
+            xs += (e.x + ext[0], e.x + ext[2])
+            ys += (e.y + ext[1], e.y + ext[3])
+        for poly in board.polygons:
+            xs += [vx for vx, _ in poly.vertices]
+            ys += [vy for _, vy in poly.vertices]
         if xs and ys:
-            self.board.bounds = (min(xs), min(ys), max(xs), max(ys))
+            board.bounds = (min(xs), min(ys), max(xs), max(ys))
         else:
-            self.board.bounds = (0.0, 0.0, 100.0, 100.0)
+            board.bounds = (0.0, 0.0, 100.0, 100.0)
+
+# ------------------------------
+# Export helpers
+# ------------------------------
+
+# SVG element templates, filled with %-formatting (one per primitive kind).
+# Polygon vertices are written with two decimals: sub-1/100 px detail is
+# invisible at the 2000 px export size and shrinks the point lists by half.
+_SVG_POINT = '%.2f,%.2f'
+_SVG_HEADER = '<svg width="%s" height="%s" xmlns="http://www.w3.org/2000/svg">\n<rect width="100%%" height="100%%" fill="#101015" />\n'
+_SVG_POLYGON = '<polygon points="%s" fill="%s" stroke="%s" stroke-width="%s" />\n'
+_SVG_OUTLINE = '<polygon points="%s" stroke="%s" stroke-width="1" fill="%s" />\n'
+_SVG_LINE = '<line x1="%s" y1="%s" x2="%s" y2="%s" stroke="%s" stroke-width="%s" />\n'
+_SVG_RING = '<circle cx="%s" cy="%s" r="%s" stroke="%s" stroke-width="1" fill="none" />\n'
+_SVG_HOLE = '<circle cx="%s" cy="%s" r="%s" fill="white" />\n'
+_SVG_TEXT = '<text x="%s" y="%s" fill="%s" font-family="Segoe UI" font-size="%s" transform="rotate(%s %s,%s)">%s</text>\n'
+_SVG_MARKER = '<line x1="%s" y1="%s" x2="%s" y2="%s" stroke="gray" stroke-width="1" />\n'
+_SVG_LABEL = '<text x="%s" y="%s" fill="white" font-family="Segoe UI" font-size="9" font-weight="bold">%s</text>\n'
+_SVG_ELEMENT = _SVG_MARKER + _SVG_MARKER + _SVG_LABEL  # cross-hair plus reference designator
+
+# Below this many wires the process start-up costs more than it saves.
+_PARALLEL_EXPORT_MIN_WIRES = 20000
+
+def _wire_runs(xs1, ys1, xs2, ys2, widths, img_scale: float) -> List[Tuple[List[float], int]]:
+    """Join consecutive wires that share an endpoint and a pixel width.
+
+    Traces are stored segment by segment in drawing order, so most of a routed
+    track collapses into one flat polyline per ``ImageDraw.line`` call.
+    ImageDraw strokes each segment of a polyline on its own, so the pixels are
+    the same as drawing the segments one by one.
+    """
+    runs: List[Tuple[List[float], int]] = []
+    points: List[float] = []
+    run_width = -1
+    for ix1, iy1, ix2, iy2, wd in zip(xs1, ys1, xs2, ys2, widths):
+        line_width = int(max(1.0, wd * img_scale))
+        if line_width == run_width and points[-2] == ix1 and points[-1] == iy1:
+            points += (ix2, iy2)
+        else:
+            points = [ix1, iy1, ix2, iy2]
+            run_width = line_width
+            runs.append((points, line_width))
+    return runs
+
+def _rasterize_wires(size: Tuple[int, int], xs1, ys1, xs2, ys2, widths, img_scale: float):
+    """Draw one layer's wires (image coordinates) into a 1-bit coverage mask.
+
+    Runs in a worker process; the caller pastes the mask in the layer colour,
+    which gives the same pixels as drawing the wires straight onto the image.
+    """
+    from PIL import Image, ImageDraw
+
+    mask = Image.new('1', size, 0)
+    draw = ImageDraw.Draw(mask)
+    for points, line_width in _wire_runs(xs1, ys1, xs2, ys2, widths, img_scale):
+        draw.line(points, fill=1, width=line_width)
+    return mask
 
 # ------------------------------
 # Viewer UI
 # ------------------------------
+# Fraction of the canvas size drawn beyond each edge, so short pans can move the
+# existing canvas items instead of redrawing the board.
+_PAN_GUARD = 0.25
+# While the wheel is turning the drawn board is scaled on the canvas; it is
+# redrawn at the new scale once no wheel step has arrived for this long.
+_ZOOM_SETTLE_MS = 150
+# Minimum interval between cursor-position updates in the status bar
+_STATUS_INTERVAL_MS = 30
+
+# EAGLE's 16-entry color palette, indexed by the layer's color attribute
+_EAGLE_PALETTE = {
+    1: "#0000FF",
+    2: "#00FF00",
+    3: "#00FFFF",
+    4: "#FF0000",
+    5: "#FF00FF",
+    6: "#FFFF00",
+    7: "#FFFFFF",
+    8: "#808080",
+    9: "#800000",
+    10: "#808000",
+    11: "#800080",
+    12: "#000080",
+    13: "#008000",
+    14: "#008080",
+    15: "#8080FF",
+}
+
+# Top/bottom layer pairs swapped when an element is mirrored onto the other side
+_FLIP_LAYER = {
+    1: 16, 16: 1,
+    21: 22, 22: 21,
+    25: 26, 26: 25,
+    29: 30, 30: 29,
+}
+
+# Colors for the common KiCad layers, keyed by layer number
+_KICAD_LAYER_COLORS = {
+    1: "#C33427",  # F.Cu
+    16: "#37965C",  # B.Cu
+    21: "#CCC3B7",  # F.SilkS
+    22: "#CCC3B7",  # B.SilkS
+    29: "#A013A0",  # F.Mask
+    30: "#A013A0",  # B.Mask
+    20: "#FFFF00",  # Edge.Cuts
+    43: "#808080",  # Dwgs.User
+}
+
 class BRDViewer(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -508,15 +910,47 @@ class BRDViewer(tk.Tk):
 
         self.board: Optional[Board] = None
         self.file_path: Optional[str] = None
+        self._is_eagle = False  # EAGLE palette colors vs the KiCad layer map; follows file_path
         self.scale = 5.0
         self.offset_x = 100.0
         self.offset_y = 100.0
 
         self.layer_checks: Dict[int, tk.BooleanVar] = {}
+        # Layer-number indexed lookup tables, rebuilt whenever a board is loaded
+        self._layer_colors: List[str] = []
+        self._layer_rgb: List[Tuple[int, int, int]] = []
+        self._layer_fills: List[str] = []
+        self._layer_fill_rgb: List[Tuple[int, int, int]] = []
+        # View state the board items on the canvas were drawn for, the offset
+        # they were drawn at and the offset they have been moved to (see redraw)
+        self._board_view: Optional[tuple] = None
+        self._board_anchor = (0.0, 0.0)
+        self._board_offset = (0.0, 0.0)
+        self._zoom_after: Optional[str] = None  # pending after() id of the settled-zoom redraw
+        # Motion events arrive faster than the canvas can be redrawn; drags and
+        # the cursor readout only act on the latest event once the loop is idle.
+        self._redraw_pending = False
+        self._status_after: Optional[str] = None
+        self._pointer = (0, 0)
+        self._wheel_steps = 0  # net wheel notches (+ zooms in) not yet applied
+        self._wheel_at = (0, 0)
+        self._wheel_pending = False
+        # Per (package, rot) world-space extent of an element's shapes, for culling
+        self._element_extents: Dict[Tuple[str, str], Optional[Tuple[float, float, float, float]]] = {}
+        # Per (package, rot) package shapes pre-rotated about the element origin
+        self._package_geoms: Dict[Tuple[str, str], list] = {}
         self.measure_mode = tk.BooleanVar(value=False)
         self.measure_points: List[Tuple[float, float]] = []
         self.selected_element: Optional[Element] = None
         self.selected_net: Optional[str] = None
+        # Component list labels and lowercase search keys, built once per board;
+        # _filtered_components is what the component list currently shows
+        self._component_labels: List[str] = []
+        self._component_keys: List[str] = []
+        self._filtered_components: List[Element] = []
+        # Sorted net names (and their lowercase forms for search), built once per board
+        self._all_nets: List[str] = []
+        self._all_nets_lower: List[str] = []
 
         self._build_ui()
         self._bind_canvas_events()
@@ -627,7 +1061,7 @@ class BRDViewer(tk.Tk):
         self.canvas.bind('<ButtonPress-2>', self._on_mid_down)
         self.canvas.bind('<B2-Motion>', self._on_mid_drag)
 
-        self._drag_start = None
+        self._drag_anchor: Optional[Tuple[float, float]] = None  # pointer position minus view offset at drag start
 
     # ----- File ops -----
     def open_brd(self):
@@ -650,6 +1084,7 @@ class BRDViewer(tk.Tk):
 
         self.board = board
         self.file_path = path
+        self._is_eagle = path.lower().endswith('.brd')
         self._populate_layers()
         self._populate_components()
         self._populate_nets()
@@ -661,7 +1096,9 @@ class BRDViewer(tk.Tk):
         if not self.board:
             messagebox.showinfo("Export", "Open a file first.")
             return
-        if not PIL_AVAILABLE:
+        # Pillow is only needed for PNG export, so it is not imported at start-up;
+        # this just checks it is installed before asking for a file name.
+        if importlib.util.find_spec('PIL') is None:
             messagebox.showerror("Export PNG", "Pillow not installed. Run: pip install pillow")
             return
         path = filedialog.asksaveasfilename(defaultextension='.png', filetypes=[('PNG Image', '*.png')])
@@ -678,108 +1115,124 @@ class BRDViewer(tk.Tk):
             return
         self._export_to_svg(path)
 
-    def _export_to_image(self, path: str, fmt: str):
-        visible_layers = {num for num, var in self.layer_checks.items() if var.get()}
+    def _export_transform(self, width: int, height: int):
+        """Fit the board into a width x height image and return the scale plus
+        column-wise world -> image converters for x and y.
+
+        Whole coordinate columns are transformed at once rather than through a
+        per-point function call.
+        """
         minx, miny, maxx, maxy = self.board.bounds or (0, 0, 100, 100)
         w_board = maxx - minx or 1
         h_board = maxy - miny or 1
-        width, height = 2000, 2000
         img_scale = min((width - 100) / w_board, (height - 100) / h_board)
         ox = (width - w_board * img_scale) / 2
         oy = (height - h_board * img_scale) / 2
 
-        def world_to_img(x: float, y: float) -> Tuple[float, float]:
-            ix = ox + (x - minx) * img_scale
-            iy = oy + (maxy - y) * img_scale
-            return ix, iy
+        def xs_to_img(xs) -> List[float]:
+            return [ox + (x - minx) * img_scale for x in xs]
+
+        def ys_to_img(ys) -> List[float]:
+            return [oy + (maxy - y) * img_scale for y in ys]
+
+        return img_scale, xs_to_img, ys_to_img
+
+    def _export_to_image(self, path: str, fmt: str):
+        from PIL import Image, ImageDraw
+
+        layers = [num for num, on in enumerate(self._visible_layer_table()) if on]
+        width, height = 2000, 2000
+        img_scale, xs_to_img, ys_to_img = self._export_transform(width, height)
 
         img = Image.new('RGB', (width, height), color=(16, 16, 21))
         draw = ImageDraw.Draw(img)
 
-        # Polygons
-        for p in self.board.polygons:
-            if p.layer not in visible_layers:
-                continue
-            color_str = self._layer_color(p.layer)
-            color = self._color_to_rgb(self._lighten_color(color_str)) if p.fill else self._color_to_rgb(color_str)
-            points = [world_to_img(vx, vy) for vx, vy in p.vertices]
+        # Polygons: transform the concatenated vertex buffer once, then slice per polygon
+        b = self.board
+        polys = [p for layer in layers for p in b.polygons_by_layer.get(layer, ())]
+        poly_ix = xs_to_img([vx for p in polys for vx, _ in p.vertices])
+        poly_iy = ys_to_img([vy for p in polys for _, vy in p.vertices])
+        start = 0
+        for p in polys:
+            end = start + len(p.vertices)
+            points = list(zip(poly_ix[start:end], poly_iy[start:end]))
+            start = end
+            color = self._layer_fill_rgb[p.layer] if p.fill else self._layer_rgb[p.layer]
             line_width = int(max(1.0, p.width * img_scale))
-            draw.polygon(points, fill=color if p.fill else None, outline=self._color_to_rgb(color_str), width=line_width)
-
-        # Wires
-        for w in self.board.wires:
-            if w.layer not in visible_layers:
-                continue
-            color = self._color_to_rgb(self._layer_color(w.layer))
-            ix1, iy1 = world_to_img(w.x1, w.y1)
-            ix2, iy2 = world_to_img(w.x2, w.y2)
-            line_width = int(max(1.0, w.width * img_scale))
-            draw.line([ix1, iy1, ix2, iy2], fill=color, width=line_width)
+            draw.polygon(points, fill=color if p.fill else None, outline=self._layer_rgb[p.layer], width=line_width)
+
+        # Wires: the columns are laid out layer by layer, so only visible spans are touched
+        wc = b.wire_cols
+        spans = [(layer,) + wc.spans[layer] for layer in layers if layer in wc.spans]
+        n_wires = sum(end - start for _, start, end in spans)
+        if len(spans) > 1 and n_wires >= _PARALLEL_EXPORT_MIN_WIRES and (os.cpu_count() or 1) > 1:
+            # Each layer rasterizes independently in its own process; the masks
+            # are composited back in layer order so overlaps come out the same.
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor() as pool:
+                futures = [(layer, pool.submit(_rasterize_wires, (width, height),
+                                               xs_to_img(wc.x1[start:end]), ys_to_img(wc.y1[start:end]),
+                                               xs_to_img(wc.x2[start:end]), ys_to_img(wc.y2[start:end]),
+                                               wc.width[start:end], img_scale))
+                           for layer, start, end in spans]
+                for layer, future in futures:
+                    img.paste(self._layer_rgb[layer], mask=future.result())
+        else:
+            for layer, start, end in spans:
+                color = self._layer_rgb[layer]
+                runs = _wire_runs(xs_to_img(wc.x1[start:end]), ys_to_img(wc.y1[start:end]),
+                                  xs_to_img(wc.x2[start:end]), ys_to_img(wc.y2[start:end]),
+                                  wc.width[start:end], img_scale)
+                for points, line_width in runs:
+                    draw.line(points, fill=color, width=line_width)
 
         # Pads
-        for p in self.board.pads:
-            if p.layer not in visible_layers:
-                continue
-            color = self._color_to_rgb(self._layer_color(p.layer))
-            ix, iy = world_to_img(p.x, p.y)
-            angle = math.radians(p.rot)
-            if p.shape != 'round' and p.dx > 0 and p.dy > 0:
-                hw = p.dx * img_scale / 2
-                hh = p.dy * img_scale / 2
-                points = [
-                    (hw * math.cos(angle) - hh * math.sin(angle), hw * math.sin(angle) + hh * math.cos(angle)),
-                    (hw * math.cos(angle) + hh * math.sin(angle), hw * math.sin(angle) - hh * math.cos(angle)),
-                    (-hw * math.cos(angle) + hh * math.sin(angle), -hw * math.sin(angle) - hh * math.cos(angle)),
-                    (-hw * math.cos(angle) - hh * math.sin(angle), -hw * math.sin(angle) + hh * math.cos(angle)),
-                ]
-                rotated_points = [(ix + px, iy + py) for px, py in points]
-                draw.polygon(rotated_points, outline=color, width=1)
-            else:
-                r = max(p.diameter, 0.1) * img_scale / 2
-                draw.ellipse([ix - r, iy - r, ix + r, iy + r], outline=color, width=1)
-            if p.drill > 0:
-                dr = p.drill * img_scale / 2
-                draw.ellipse([ix - dr, iy - dr, ix + dr, iy + dr], fill='white')
+        pc = b.pad_cols
+        for layer in layers:
+            start, end = pc.spans.get(layer, (0, 0))
+            color = self._layer_rgb[layer]
+            for ix, iy, dx, dy, rot, drill, diameter, shape in zip(
+                    xs_to_img(pc.x[start:end]), ys_to_img(pc.y[start:end]), pc.dx[start:end], pc.dy[start:end],
+                    pc.rot[start:end], pc.drill[start:end], pc.diameter[start:end], pc.shape[start:end]):
+                if shape != 'round' and dx > 0 and dy > 0:
+                    rotated_points = [(ix + px * img_scale, iy + py * img_scale) for px, py in _footprint_corners(dx, dy, rot)]
+                    draw.polygon(rotated_points, outline=color, width=1)
+                else:
+                    r = max(diameter, 0.1) * img_scale / 2
+                    draw.ellipse([ix - r, iy - r, ix + r, iy + r], outline=color, width=1)
+                if drill > 0:
+                    dr = drill * img_scale / 2
+                    draw.ellipse([ix - dr, iy - dr, ix + dr, iy + dr], fill='white')
 
         # SMDs
-        for s in self.board.smds:
-            if s.layer not in visible_layers:
-                continue
-            color = self._color_to_rgb(self._layer_color(s.layer))
-            ix, iy = world_to_img(s.x, s.y)
-            angle = math.radians(s.rot)
-            hw = s.dx * img_scale / 2
-            hh = s.dy * img_scale / 2
-            points = [
-                (hw * math.cos(angle) - hh * math.sin(angle), hw * math.sin(angle) + hh * math.cos(angle)),
-                (hw * math.cos(angle) + hh * math.sin(angle), hw * math.sin(angle) - hh * math.cos(angle)),
-                (-hw * math.cos(angle) + hh * math.sin(angle), -hw * math.sin(angle) - hh * math.cos(angle)),
-                (-hw * math.cos(angle) - hh * math.sin(angle), -hw * math.sin(angle) + hh * math.cos(angle)),
-            ]
-            rotated_points = [(ix + px, iy + py) for px, py in points]
-            draw.polygon(rotated_points, fill=color, outline=color, width=1)
+        sc = b.smd_cols
+        for layer in layers:
+            start, end = sc.spans.get(layer, (0, 0))
+            color = self._layer_rgb[layer]
+            for ix, iy, dx, dy, rot in zip(xs_to_img(sc.x[start:end]), ys_to_img(sc.y[start:end]),
+                                           sc.dx[start:end], sc.dy[start:end], sc.rot[start:end]):
+                rotated_points = [(ix + px * img_scale, iy + py * img_scale) for px, py in _footprint_corners(dx, dy, rot)]
+                draw.polygon(rotated_points, fill=color, outline=color, width=1)
 
         # Vias
-        for v in self.board.vias:
-            ix, iy = world_to_img(v.x, v.y)
-            r = max(v.diameter or 0, v.drill or 0.1) * img_scale / 2
+        vc = self.board.via_cols
+        for ix, iy, drill, diameter in zip(xs_to_img(vc.x), ys_to_img(vc.y), vc.drill, vc.diameter):
+            r = max(diameter or 0, drill or 0.1) * img_scale / 2
             draw.ellipse([ix - r, iy - r, ix + r, iy + r], outline='white', width=1)
-            if v.drill > 0:
-                dr = v.drill * img_scale / 2
+            if drill > 0:
+                dr = drill * img_scale / 2
                 draw.ellipse([ix - dr, iy - dr, ix + dr, iy + dr], fill='white')
 
         # Texts
-        for t in self.board.texts:
-            if t.layer not in visible_layers:
-                continue
-            color = self._color_to_rgb(self._layer_color(t.layer))
-            ix, iy = world_to_img(t.x, t.y)
+        texts = [t for layer in layers for t in b.texts_by_layer.get(layer, ())]
+        for t, ix, iy in zip(texts, xs_to_img([t.x for t in texts]), ys_to_img([t.y for t in texts])):
+            color = self._layer_rgb[t.layer]
             font_size = int(t.size * img_scale)
             draw.text((ix, iy), t.text, fill=color, font_size=font_size)  # no rotation in PIL draw.text
 
         # Elements (markers only)
-        for e in self.board.elements:
-            ix, iy = world_to_img(e.x, e.y)
+        elements = self.board.elements
+        for ix, iy in zip(xs_to_img([e.x for e in elements]), ys_to_img([e.y for e in elements])):
             size_px = 6
             draw.line((ix - size_px, iy, ix + size_px, iy), fill='gray', width=1)
             draw.line((ix, iy - size_px, ix, iy + size_px), fill='gray', width=1)
@@ -788,120 +1241,103 @@ class BRDViewer(tk.Tk):
         self.status_lbl.config(text=f"Exported {fmt.upper()}: {os.path.basename(path)}")
 
     def _export_to_svg(self, path: str):
-        visible_layers = {num for num, var in self.layer_checks.items() if var.get()}
-        minx, miny, maxx, maxy = self.board.bounds or (0, 0, 100, 100)
-        w_board = maxx - minx or 1
-        h_board = maxy - miny or 1
+        layers = [num for num, on in enumerate(self._visible_layer_table()) if on]
+        b = self.board
         width, height = 2000, 2000
-        img_scale = min((width - 100) / w_board, (height - 100) / h_board)
-        ox = (width - w_board * img_scale) / 2
-        oy = (height - h_board * img_scale) / 2
-
-        def world_to_img(x: float, y: float) -> Tuple[float, float]:
-            ix = ox + (x - minx) * img_scale
-            iy = oy + (maxy - y) * img_scale
-            return ix, iy
-
-        svg_content = f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">\n<rect width="100%" height="100%" fill="#101015" />\n'
-        # Polygons
-        for p in self.board.polygons:
-            if p.layer not in visible_layers:
-                continue
-            color = self._layer_color(p.layer)
-            fill = self._lighten_color(color) if p.fill else 'none'
-            points_str = ' '.join(f'{world_to_img(vx, vy)[0]},{world_to_img(vx, vy)[1]}' for vx, vy in p.vertices)
-            line_width = max(1.0, p.width * img_scale)
-            svg_content += f'<polygon points="{points_str}" fill="{fill}" stroke="{color}" stroke-width="{line_width}" />\n'
-
-        # Wires
-        for w in self.board.wires:
-            if w.layer not in visible_layers:
-                continue
-            color = self._layer_color(w.layer)
-            ix1, iy1 = world_to_img(w.x1, w.y1)
-            ix2, iy2 = world_to_img(w.x2, w.y2)
-            line_width = max(1.0, w.width * img_scale)
-            svg_content += f'<line x1="{ix1}" y1="{iy1}" x2="{ix2}" y2="{iy2}" stroke="{color}" stroke-width="{line_width}" />\n'
-
-        # Pads
-        for p in self.board.pads:
-            if p.layer not in visible_layers:
-                continue
-            color = self._layer_color(p.layer)
-            ix, iy = world_to_img(p.x, p.y)
-            angle = math.radians(p.rot)
-            if p.shape != 'round' and p.dx > 0 and p.dy > 0:
-                hw = p.dx * img_scale / 2
-                hh = p.dy * img_scale / 2
-                points = [
-                    (hw * math.cos(angle) - hh * math.sin(angle), hw * math.sin(angle) + hh * math.cos(angle)),
-                    (hw * math.cos(angle) + hh * math.sin(angle), hw * math.sin(angle) - hh * math.cos(angle)),
-                    (-hw * math.cos(angle) + hh * math.sin(angle), -hw * math.sin(angle) - hh * math.cos(angle)),
-                    (-hw * math.cos(angle) - hh * math.sin(angle), -hw * math.sin(angle) + hh * math.cos(angle)),
-                ]
-                points_str = ' '.join(f'{ix + px},{iy + py}' for px, py in points)
-                svg_content += f'<polygon points="{points_str}" stroke="{color}" stroke-width="1" fill="none" />\n'
-            else:
-                r = max(p.diameter, 0.1) * img_scale / 2
-                svg_content += f'<circle cx="{ix}" cy="{iy}" r="{r}" stroke="{color}" stroke-width="1" fill="none" />\n'
-            if p.drill > 0:
-                dr = p.drill * img_scale / 2
-                svg_content += f'<circle cx="{ix}" cy="{iy}" r="{dr}" fill="white" />\n'
-
-        # SMDs
-        for s in self.board.smds:
-            if s.layer not in visible_layers:
-                continue
-            color = self._layer_color(s.layer)
-            ix, iy = world_to_img(s.x, s.y)
-            angle = math.radians(s.rot)
-            hw = s.dx * img_scale / 2
-            hh = s.dy * img_scale / 2
-            points = [
-                (hw * math.cos(angle) - hh * math.sin(angle), hw * math.sin(angle) + hh * math.cos(angle)),
-                (hw * math.cos(angle) + hh * math.sin(angle), hw * math.sin(angle) - hh * math.cos(angle)),
-                (-hw * math.cos(angle) + hh * math.sin(angle), -hw * math.sin(angle) - hh * math.cos(angle)),
-                (-hw * math.cos(angle) - hh * math.sin(angle), -hw * math.sin(angle) + hh * math.cos(angle)),
-            ]
-            points_str = ' '.join(f'{ix + px},{iy + py}' for px, py in points)
-            svg_content += f'<polygon points="{points_str}" stroke="{color}" stroke-width="1" fill="{color}" />\n'
-
-        # Vias
-        for v in self.board.vias:
-            ix, iy = world_to_img(v.x, v.y)
-            r = max(v.diameter or 0, v.drill or 0.1) * img_scale / 2
-            svg_content += f'<circle cx="{ix}" cy="{iy}" r="{r}" stroke="white" stroke-width="1" fill="none" />\n'
-            if v.drill > 0:
-                dr = v.drill * img_scale / 2
-                svg_content += f'<circle cx="{ix}" cy="{iy}" r="{dr}" fill="white" />\n'
-
-        # Texts
-        for t in self.board.texts:
-            if t.layer not in visible_layers:
-                continue
-            color = self._layer_color(t.layer)
-            ix, iy = world_to_img(t.x, t.y)
-            font_size = int(t.size * img_scale)
-            svg_content += f'<text x="{ix}" y="{iy}" fill="{color}" font-family="Segoe UI" font-size="{font_size}" transform="rotate({t.rot} {ix},{iy})">{t.text}</text>\n'
-
-        # Elements
-        for e in self.board.elements:
-            ix, iy = world_to_img(e.x, e.y)
+        img_scale, xs_to_img, ys_to_img = self._export_transform(width, height)
+
+        # Primitives are written as they are produced; the 1 MiB buffer keeps
+        # the number of write syscalls low without holding the whole document.
+        with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            write = f.write
+            writelines = f.writelines
+            write(_SVG_HEADER % (width, height))
+            # Polygons: transform the concatenated vertex buffer once, then slice per polygon
+            polys = [p for layer in layers for p in b.polygons_by_layer.get(layer, ())]
+            poly_ix = xs_to_img([vx for p in polys for vx, _ in p.vertices])
+            poly_iy = ys_to_img([vy for p in polys for _, vy in p.vertices])
+            start = 0
+            for p in polys:
+                end = start + len(p.vertices)
+                points_str = ' '.join([_SVG_POINT % xy for xy in zip(poly_ix[start:end], poly_iy[start:end])])
+                start = end
+                color = self._layer_colors[p.layer]
+                fill = self._layer_fills[p.layer] if p.fill else 'none'
+                line_width = max(1.0, p.width * img_scale)
+                write(_SVG_POLYGON % (points_str, fill, color, line_width))
+
+            # Wires
+            wc = b.wire_cols
+            for layer in layers:
+                start, end = wc.spans.get(layer, (0, 0))
+                color = self._layer_colors[layer]
+                writelines(_SVG_LINE % (ix1, iy1, ix2, iy2, color, max(1.0, wd * img_scale))
+                           for ix1, iy1, ix2, iy2, wd in zip(xs_to_img(wc.x1[start:end]), ys_to_img(wc.y1[start:end]),
+                                                              xs_to_img(wc.x2[start:end]), ys_to_img(wc.y2[start:end]),
+                                                              wc.width[start:end]))
+
+            # Pads
+            pc = b.pad_cols
+            for layer in layers:
+                start, end = pc.spans.get(layer, (0, 0))
+                color = self._layer_colors[layer]
+                for ix, iy, dx, dy, rot, drill, diameter, shape in zip(
+                        xs_to_img(pc.x[start:end]), ys_to_img(pc.y[start:end]), pc.dx[start:end], pc.dy[start:end],
+                        pc.rot[start:end], pc.drill[start:end], pc.diameter[start:end], pc.shape[start:end]):
+                    if shape != 'round' and dx > 0 and dy > 0:
+                        points_str = ' '.join([_SVG_POINT % (ix + px * img_scale, iy + py * img_scale)
+                                               for px, py in _footprint_corners(dx, dy, rot)])
+                        write(_SVG_OUTLINE % (points_str, color, 'none'))
+                    else:
+                        r = max(diameter, 0.1) * img_scale / 2
+                        write(_SVG_RING % (ix, iy, r, color))
+                    if drill > 0:
+                        dr = drill * img_scale / 2
+                        write(_SVG_HOLE % (ix, iy, dr))
+
+            # SMDs
+            sc = b.smd_cols
+            for layer in layers:
+                start, end = sc.spans.get(layer, (0, 0))
+                color = self._layer_colors[layer]
+                for ix, iy, dx, dy, rot in zip(xs_to_img(sc.x[start:end]), ys_to_img(sc.y[start:end]),
+                                               sc.dx[start:end], sc.dy[start:end], sc.rot[start:end]):
+                    points_str = ' '.join([_SVG_POINT % (ix + px * img_scale, iy + py * img_scale)
+                                           for px, py in _footprint_corners(dx, dy, rot)])
+                    write(_SVG_OUTLINE % (points_str, color, color))
+
+            # Vias
+            vc = b.via_cols
+            writelines(_SVG_RING % (ix, iy, max(diameter or 0, drill or 0.1) * img_scale / 2, 'white')
+                       + (_SVG_HOLE % (ix, iy, drill * img_scale / 2) if drill > 0 else '')
+                       for ix, iy, drill, diameter in zip(xs_to_img(vc.x), ys_to_img(vc.y), vc.drill, vc.diameter))
+
+            # Texts
+            texts = [t for layer in layers for t in b.texts_by_layer.get(layer, ())]
+            colors = self._layer_colors
+            writelines(_SVG_TEXT % (ix, iy, colors[t.layer], int(t.size * img_scale), t.rot, ix, iy, t.text)
+                       for t, ix, iy in zip(texts, xs_to_img([t.x for t in texts]), ys_to_img([t.y for t in texts])))
+
+            # Elements
+            elements = b.elements
             size = 6
-            svg_content += f'<line x1="{ix - size}" y1="{iy}" x2="{ix + size}" y2="{iy}" stroke="gray" stroke-width="1" />\n'
-            svg_content += f'<line x1="{ix}" y1="{iy - size}" x2="{ix}" y2="{iy + size}" stroke="gray" stroke-width="1" />\n'
-            svg_content += f'<text x="{ix + 8}" y="{iy - 8}" fill="white" font-family="Segoe UI" font-size="9" font-weight="bold">{e.name}</text>\n'
+            writelines(_SVG_ELEMENT % (ix - size, iy, ix + size, iy, ix, iy - size, ix, iy + size, ix + 8, iy - 8, e.name)
+                       for e, ix, iy in zip(elements, xs_to_img([e.x for e in elements]), ys_to_img([e.y for e in elements])))
 
-        svg_content += '</svg>'
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
+            write('</svg>')
         self.status_lbl.config(text=f"Exported SVG: {os.path.basename(path)}")
 
-    def _color_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
+    # Both color helpers are pure and see only a handful of distinct inputs
+    # (one per layer), so their results are memoized.
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _color_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         hex_color = hex_color.lstrip('#')
         return tuple(int(hex_color[i:i + 2], 16) for i in range(0, 6, 2))
 
-    def _lighten_color(self, hex_color, factor=0.5):
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _lighten_color(hex_color, factor=0.5):
         hex_color = hex_color.lstrip('#')
         rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
         white = (255, 255, 255)
@@ -924,6 +1360,7 @@ class BRDViewer(tk.Tk):
         path = filedialog.asksaveasfilename(title='Save Project', defaultextension='.pvproj', filetypes=[('PCB Viewer Project', '*.pvproj')])
         if not path:
             return
+        import json
         try:
             with open(path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2)
@@ -935,6 +1372,7 @@ class BRDViewer(tk.Tk):
         path = filedialog.askopenfilename(title='Load Project', filetypes=[('PCB Viewer Project', '*.pvproj'), ('All Files', '*.*')])
         if not path:
             return
+        import json
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -952,6 +1390,7 @@ class BRDViewer(tk.Tk):
                 board = parser.parse()
                 self.board = board
                 self.file_path = brd_path
+                self._is_eagle = brd_path.lower().endswith('.brd')
                 self._populate_layers()
                 self._populate_components()
                 self._populate_nets()
@@ -987,24 +1426,59 @@ class BRDViewer(tk.Tk):
             cb.pack(anchor='w', padx=8, pady=2)
             self.layer_checks[L.number] = var
         self.layer_canvas.update_idletasks()
+        self._build_layer_tables()
+
+    def _build_layer_tables(self):
+        """Precompute per-layer colors (and the lightened copper-pour fills) as
+        lists indexed by layer number."""
+        b = self.board
+        top = max([255] + list(b.layers) + list(b.wire_cols.layer)
+                  + [item.layer for items in (b.pads, b.smds, b.polygons, b.texts) for item in items]
+                  + [shape.layer for shapes in b.packages.values() for shape in shapes])
+        self._layer_colors = [self._layer_color(num) for num in range(top + 1)]
+        self._layer_rgb = [self._color_to_rgb(c) for c in self._layer_colors]
+        self._layer_fills = [self._lighten_color(c) for c in self._layer_colors]
+        self._layer_fill_rgb = [self._color_to_rgb(c) for c in self._layer_fills]
+        self._board_view = None
+        self._element_extents = {}
+        self._package_geoms = {}
+
+    def _visible_layer_table(self) -> List[bool]:
+        """Visibility flags indexed by layer number, read from the layer checkboxes."""
+        visible = [False] * len(self._layer_colors)
+        for num, var in self.layer_checks.items():
+            if var.get():
+                visible[num] = True
+        return visible
 
     def _populate_components(self):
         self.comp_list.delete(0, tk.END)
-        if not self.board:
-            return
-        for e in self.board.elements:
-            label = f"{e.name}  ({e.value})  @{e.x:.3f},{e.y:.3f}"
-            self.comp_list.insert(tk.END, label)
+        self._rebuild_search_index()
+        self._filtered_components = self.board.elements if self.board else []
+        if self._component_labels:
+            self.comp_list.insert(tk.END, *self._component_labels)
+
+    def _rebuild_search_index(self):
+        elements = self.board.elements if self.board else []
+        self._component_labels = [f"{e.name}  ({e.value})  @{e.x:.3f},{e.y:.3f}" for e in elements]
+        # One lowercase key per element; the NUL separators keep a query from
+        # matching across the name/value/package boundaries.
+        self._component_keys = [f"{e.name}\0{e.value}\0{e.package}".lower() for e in elements]
 
     def _on_search(self, event=None):
         if not self.board:
             return
         q = self.search_var.get().strip().lower()
         self.comp_list.delete(0, tk.END)
-        for e in self.board.elements:
-            label = f"{e.name}  ({e.value})  @{e.x:.3f},{e.y:.3f}"
-            if not q or q in e.name.lower() or q in e.value.lower() or q in e.package.lower():
-                self.comp_list.insert(tk.END, label)
+        if not q:
+            self._filtered_components = self.board.elements
+            labels = self._component_labels
+        else:
+            hits = [i for i, key in enumerate(self._component_keys) if q in key]
+            self._filtered_components = [self.board.elements[i] for i in hits]
+            labels = [self._component_labels[i] for i in hits]
+        if labels:
+            self.comp_list.insert(tk.END, *labels)
 
     def _on_component_select(self, event=None):
         if not self.board:
@@ -1013,8 +1487,7 @@ class BRDViewer(tk.Tk):
         if not sel:
             return
         idx = sel[0]
-        q = self.search_var.get().strip().lower()
-        filtered = [e for e in self.board.elements if (not q or q in e.name.lower() or q in e.value.lower() or q in e.package.lower())]
+        filtered = self._filtered_components
         if 0 <= idx < len(filtered):
             self.selected_element = filtered[idx]
             self.selected_net = None
@@ -1024,38 +1497,27 @@ class BRDViewer(tk.Tk):
     def _populate_nets(self):
         self.net_list.delete(0, tk.END)
         if not self.board:
+            self._all_nets = []
+            self._all_nets_lower = []
             return
-        nets = set()
-        for w in self.board.wires:
-            if w.net:
-                nets.add(w.net)
-        for v in self.board.vias:
-            if v.net:
-                nets.add(v.net)
-        for poly in self.board.polygons:
-            if poly.net:
-                nets.add(poly.net)
-        for net in sorted(nets):
-            self.net_list.insert(tk.END, net)
+        # The net index already holds every named net exactly once
+        self._all_nets = sorted(self.board.net_index)
+        self._all_nets_lower = [net.lower() for net in self._all_nets]
+        self.net_list.insert(tk.END, *self._all_nets)
+
+    def _filtered_nets(self) -> List[str]:
+        q = self.net_search_var.get().strip().lower()
+        if not q:
+            return self._all_nets
+        return [net for net, low in zip(self._all_nets, self._all_nets_lower) if q in low]
 
     def _on_net_search(self, event=None):
         if not self.board:
             return
-        q = self.net_search_var.get().strip().lower()
         self.net_list.delete(0, tk.END)
-        nets = set()
-        for w in self.board.wires:
-            if w.net:
-                nets.add(w.net)
-        for v in self.board.vias:
-            if v.net:
-                nets.add(v.net)
-        for poly in self.board.polygons:
-            if poly.net:
-                nets.add(poly.net)
-        for net in sorted(nets):
-            if not q or q in net.lower():
-                self.net_list.insert(tk.END, net)
+        nets = self._filtered_nets()
+        if nets:
+            self.net_list.insert(tk.END, *nets)
 
     def _on_net_select(self, event=None):
         if not self.board:
@@ -1064,18 +1526,7 @@ class BRDViewer(tk.Tk):
         if not sel:
             return
         idx = sel[0]
-        q = self.net_search_var.get().strip().lower()
-        nets = set()
-        for w in self.board.wires:
-            if w.net:
-                nets.add(w.net)
-        for v in self.board.vias:
-            if v.net:
-                nets.add(v.net)
-        for poly in self.board.polygons:
-            if poly.net:
-                nets.add(poly.net)
-        filtered = [n for n in sorted(nets) if not q or q in n.lower()]
+        filtered = self._filtered_nets()
         if 0 <= idx < len(filtered):
             self.selected_net = filtered[idx]
             self.selected_element = None
@@ -1140,44 +1591,186 @@ class BRDViewer(tk.Tk):
         self.redraw()
 
     def redraw(self):
-        self.canvas.delete('all')
         if not self.board:
+            self.canvas.delete('all')
+            self._board_view = None
             return
-        self._draw_grid()
-        visible_layers = {num for num, var in self.layer_checks.items() if var.get()}
-        for p in self.board.polygons:
-            if p.layer in visible_layers:
+        visible = self._visible_layer_table()
+        cw = self.canvas.winfo_width()
+        ch = self.canvas.winfo_height()
+        # The board itself only changes with the scale, the canvas size or the
+        # layer visibility; selection and measurement are drawn on top of it.
+        # The board is drawn with a guard band around the canvas, so a pan that
+        # stays inside the band just moves the existing items, and when only
+        # the overlays change the board items are kept as they are.
+        view = (self.scale, cw, ch, visible)
+        ax, ay = self._board_anchor
+        if (view == self._board_view and abs(self.offset_x - ax) <= cw * _PAN_GUARD
+                and abs(self.offset_y - ay) <= ch * _PAN_GUARD):
+            dx = self.offset_x - self._board_offset[0]
+            dy = self.offset_y - self._board_offset[1]
+            if dx or dy:
+                self.canvas.move('board', dx, dy)
+            self.canvas.delete('!board')
+        else:
+            self.canvas.delete('all')
+            self._draw_board(visible)
+            self.canvas.addtag_all('board')
+            self._board_view = view
+            self._board_anchor = (self.offset_x, self.offset_y)
+        self._board_offset = (self.offset_x, self.offset_y)
+        self._draw_overlays(visible)
+
+    def _draw_board(self, visible: List[bool]):
+        cw = max(self.canvas.winfo_width(), 1)
+        ch = max(self.canvas.winfo_height(), 1)
+        gx = cw * _PAN_GUARD
+        gy = ch * _PAN_GUARD
+        self._draw_grid(-gx, -gy, cw + gx, ch + gy)
+        layers = [num for num, on in enumerate(visible) if on]
+        b = self.board
+        # World rectangle covered by the canvas and its guard band, with a few
+        # pixels of slack for outlines; anything whose box lies fully outside it
+        # is not drawn.
+        slack = 4 / self.scale
+        wx0, wy1 = self.screen_to_world(-gx, -gy)
+        wx1, wy0 = self.screen_to_world(cw + gx, ch + gy)
+        wx0 -= slack
+        wy0 -= slack
+        wx1 += slack
+        wy1 += slack
+        # Zoomed in, the grid index narrows each bucket to the items near the
+        # view before the exact box test; zoomed out, a plain scan is cheaper.
+        minx, miny, maxx, maxy = b.bounds or (0.0, 0.0, 100.0, 100.0)
+        use_grid = (wx1 - wx0) * (wy1 - wy0) < 0.25 * (maxx - minx) * (maxy - miny)
+        grids = b.layer_grids
+
+        def near_view(kind: str, buckets, layer: int):
+            items = buckets.get(layer, ())
+            grid = grids.get(kind, {}).get(layer) if use_grid else None
+            if grid is None:
+                return items
+            return [items[i] for i in grid.query(wx0, wy0, wx1, wy1)]
+
+        for layer in layers:
+            for p in near_view('polygons', b.polygons_by_layer, layer):
+                x0, y0, x1, y1 = p.bbox()
+                m = p.width / 2
+                if x1 + m < wx0 or x0 - m > wx1 or y1 + m < wy0 or y0 - m > wy1:
+                    continue
                 self._draw_polygon(p)
-        for w in self.board.wires:
-            if w.layer in visible_layers:
-                self._draw_wire(w)
-        for p in self.board.pads:
-            if p.layer in visible_layers:
+        # Wires are the most numerous primitive, so their loop inlines
+        # _draw_wire with the view transform and canvas method held in locals.
+        # As in the exporters, consecutive wires that share an endpoint and a
+        # pixel width are coalesced into one polyline item.
+        scale = self.scale
+        ox = self.offset_x
+        oy = self.offset_y
+        create_line = self.canvas.create_line
+        for layer in layers:
+            color = self._layer_colors[layer]
+            points: List[float] = []
+            run_width = 0
+            for w in near_view('wires', b.wires_by_layer, layer):
+                m = w.width / 2
+                if ((w.x1 + m < wx0 and w.x2 + m < wx0) or (w.x1 - m > wx1 and w.x2 - m > wx1)
+                        or (w.y1 + m < wy0 and w.y2 + m < wy0) or (w.y1 - m > wy1 and w.y2 - m > wy1)):
+                    continue
+                sx1 = ox + w.x1 * scale
+                sy1 = oy - w.y1 * scale
+                width = int(w.width * scale) or 1
+                if width == run_width and points[-2] == sx1 and points[-1] == sy1:
+                    points += (ox + w.x2 * scale, oy - w.y2 * scale)
+                    continue
+                if points:
+                    create_line(points, fill=color, width=run_width)
+                points = [sx1, sy1, ox + w.x2 * scale, oy - w.y2 * scale]
+                run_width = width
+            if points:
+                create_line(points, fill=color, width=run_width)
+        for layer in layers:
+            for p in near_view('pads', b.pads_by_layer, layer):
+                m = _pad_reach(p)
+                if p.x + m < wx0 or p.x - m > wx1 or p.y + m < wy0 or p.y - m > wy1:
+                    continue
                 self._draw_pad(p)
-        for s in self.board.smds:
-            if s.layer in visible_layers:
+        for layer in layers:
+            for s in near_view('smds', b.smds_by_layer, layer):
+                m = max(s.dx, s.dy) * 0.75
+                if s.x + m < wx0 or s.x - m > wx1 or s.y + m < wy0 or s.y - m > wy1:
+                    continue
                 self._draw_smd(s)
-        for v in self.board.vias:
+        via_slack = 3 / self.scale
+        vias = b.vias
+        if use_grid and b.via_grid is not None:
+            vias = [vias[i] for i in b.via_grid.query(wx0 - via_slack, wy0 - via_slack, wx1 + via_slack, wy1 + via_slack)]
+        for v in vias:
+            m = max(v.diameter, v.drill) / 2 + via_slack
+            if v.x + m < wx0 or v.x - m > wx1 or v.y + m < wy0 or v.y - m > wy1:
+                continue
             self._draw_via(v)
-        for t in self.board.texts:
-            if t.layer in visible_layers:
+        for layer in layers:
+            for t in near_view('texts', b.texts_by_layer, layer):
+                m = t.size * max(len(t.text), 1)
+                if t.x + m < wx0 or t.x - m > wx1 or t.y + m < wy0 or t.y - m > wy1:
+                    continue
                 self._draw_text(t)
+        # Marker cross and name label: about 14 px around the origin plus ~8 px per character
+        label_slack = 14 / self.scale
+        char_slack = 8 / self.scale
         for e in self.board.elements:
+            ext = self._element_extent(e)
+            x0, y0, x1, y1 = ext if ext else (0.0, 0.0, 0.0, 0.0)
+            m = label_slack + char_slack * len(e.name)
+            if (min(x0, -m) + e.x > wx1 or max(x1, m) + e.x < wx0
+                    or min(y0, -m) + e.y > wy1 or max(y1, m) + e.y < wy0):
+                continue
             self._draw_element_marker(e)
-            self._draw_element_shapes(e, visible_layers, highlight=(e == self.selected_element))
-
+            self._draw_element_shapes(e, visible)
+
+    def _element_extent(self, e: Element) -> Optional[Tuple[float, float, float, float]]:
+        """Extent of an element's package shapes relative to its origin, grown by
+        the largest shape half-size; cached per (package, rot)."""
+        key = (e.package, e.rot)
+        if key in self._element_extents:
+            return self._element_extents[key]
+        shapes = self.board.packages.get(e.package, [])
+        margin = 0.0
+        for shape in shapes:
+            if isinstance(shape, Wire):
+                margin = max(margin, shape.width / 2)
+            elif isinstance(shape, Pad):
+                margin = max(margin, _pad_reach(shape))
+            elif isinstance(shape, SMD):
+                margin = max(margin, max(shape.dx, shape.dy) * 0.75)
+            elif isinstance(shape, Circle):
+                margin = max(margin, shape.radius + shape.width / 2)
+            elif isinstance(shape, Polygon):
+                margin = max(margin, shape.width / 2)
+        sin_a, cos_a = _sincos(_parse_rot(e.rot))
+        ext = _rotated_extent(self.board.package_hull.get(e.package, []), cos_a, sin_a, 'M' in e.rot)
+        if ext is not None:
+            ext = (ext[0] - margin, ext[1] - margin, ext[2] + margin, ext[3] + margin)
+        self._element_extents[key] = ext
+        return ext
+
+    def _draw_overlays(self, visible: List[bool]):
+        b = self.board
         if self.selected_net:
-            for p in self.board.polygons:
-                if p.net == self.selected_net and p.layer in visible_layers:
+            wire_ids, via_ids, poly_ids = b.net_index.get(self.selected_net, ((), (), ()))
+            for i in poly_ids:
+                p = b.polygons[i]
+                if visible[p.layer]:
                     self._draw_polygon(p, highlight=True)
-            for w in self.board.wires:
-                if w.net == self.selected_net and w.layer in visible_layers:
+            for i in wire_ids:
+                w = b.wires[i]
+                if visible[w.layer]:
                     self._draw_wire(w, highlight=True)
-            for v in self.board.vias:
-                if v.net == self.selected_net:
-                    self._draw_via(v, highlight=True)
+            for i in via_ids:
+                self._draw_via(b.vias[i], highlight=True)
 
         if self.selected_element:
+            self._draw_element_shapes(self.selected_element, visible, highlight=True)
             sx, sy = self.world_to_screen(self.selected_element.x, self.selected_element.y)
             r = 20
             self.canvas.create_oval(sx - r, sy - r, sx + r, sy + r, outline="#FFFF00", width=2)
@@ -1194,60 +1787,34 @@ class BRDViewer(tk.Tk):
             midx, midy = (sx1+sx2)/2, (sy1+sy2)/2
             self.canvas.create_text(midx+8, midy-8, text=f"{d:.3f} units", fill="#A0FFA0", anchor='w', font=("Segoe UI", 9, "bold"))
 
-    def _draw_grid(self):
-        cw = self.canvas.winfo_width()
-        ch = self.canvas.winfo_height()
-        if cw <= 0 or ch <= 0:
+    def _draw_grid(self, x0: float, y0: float, x1: float, y1: float):
+        """Grid lines over the screen rectangle (x0, y0)-(x1, y1)."""
+        if x1 <= x0 or y1 <= y0:
             return
         step_world = max(1.0, 50.0 / max(self.scale, 0.0001))
-        start_x_world, start_y_world = self.screen_to_world(0, 0)
-        end_x_world, end_y_world = self.screen_to_world(cw, ch)
-        gx = math.floor(start_x_world/step_world)*step_world
-        while gx < end_x_world:
-            sx, _ = self.world_to_screen(gx, 0)
-            self.canvas.create_line(sx, 0, sx, ch, fill="#151525")
-            gx += step_world
-        gy = math.floor(start_y_world/step_world)*step_world
-        while gy < end_y_world:
-            _, sy = self.world_to_screen(0, gy)
-            self.canvas.create_line(0, sy, cw, sy, fill="#151525")
-            gy += step_world
+        start_x_world, start_y_world = self.screen_to_world(x0, y0)
+        end_x_world, end_y_world = self.screen_to_world(x1, y1)
+        # Line k sits at first + k * step; computing each position directly
+        # (rather than accumulating) keeps the loops free of method calls.
+        scale = self.scale
+        create_line = self.canvas.create_line
+        first_x = math.floor(start_x_world / step_world) * step_world
+        for k in range(math.ceil((end_x_world - first_x) / step_world)):
+            sx = self.offset_x + (first_x + k * step_world) * scale
+            create_line(sx, y0, sx, y1, fill="#151525")
+        first_y = math.floor(start_y_world / step_world) * step_world
+        for k in range(math.ceil((end_y_world - first_y) / step_world)):
+            sy = self.offset_y - (first_y + k * step_world) * scale
+            create_line(x0, sy, x1, sy, fill="#151525")
 
     def _get_eagle_palette_color(self, index: int) -> str:
-        palette = {
-            1: "#0000FF",
-            2: "#00FF00",
-            3: "#00FFFF",
-            4: "#FF0000",
-            5: "#FF00FF",
-            6: "#FFFF00",
-            7: "#FFFFFF",
-            8: "#808080",
-            9: "#800000",
-            10: "#808000",
-            11: "#800080",
-            12: "#000080",
-            13: "#008000",
-            14: "#008080",
-            15: "#8080FF",
-        }
-        return palette.get(index, "#FFFFFF")
+        return _EAGLE_PALETTE.get(index, "#FFFFFF")
 
     def _get_kicad_layer_color(self, num: int) -> str:
-        map_ = {
-            1: "#C33427",  # F.Cu
-            16: "#37965C",  # B.Cu
-            21: "#CCC3B7",  # F.SilkS
-            22: "#CCC3B7",  # B.SilkS
-            29: "#A013A0",  # F.Mask
-            30: "#A013A0",  # B.Mask
-            20: "#FFFF00",  # Edge.Cuts
-            43: "#808080",  # Dwgs.User
-        }
-        return map_.get(num, "#00FFD1")
+        return _KICAD_LAYER_COLORS.get(num, "#00FFD1")
 
     def _layer_color(self, layer_num: int) -> str:
-        if self.file_path and self.file_path.lower().endswith('.brd'):
+        if self._is_eagle:
             color_index = self.board.layers.get(layer_num, Layer(0, "", 7)).color
             return self._get_eagle_palette_color(color_index)
         else:
@@ -1256,49 +1823,42 @@ class BRDViewer(tk.Tk):
     def _draw_wire(self, w: Wire, highlight: bool = False):
         sx1, sy1 = self.world_to_screen(w.x1, w.y1)
         sx2, sy2 = self.world_to_screen(w.x2, w.y2)
-        color = "#FFFF00" if highlight else self._layer_color(w.layer)
-        width = max(1, int(w.width * self.scale)) + (2 if highlight else 0)
+        color = "#FFFF00" if highlight else self._layer_colors[w.layer]
+        width = (int(w.width * self.scale) or 1) + (2 if highlight else 0)
         self.canvas.create_line(sx1, sy1, sx2, sy2, fill=color, width=width)
 
     def _draw_pad(self, p: Pad, highlight: bool = False):
         sx, sy = self.world_to_screen(p.x, p.y)
-        color = "#FFFF00" if highlight else self._layer_color(p.layer)
-        angle = math.radians(p.rot)
+        self._create_pad(sx, sy, p, p.layer, p.rot, highlight)
+
+    def _create_pad(self, sx: float, sy: float, p: Pad, layer: int, rot: float, highlight: bool):
+        """Pad p centred on screen point (sx, sy), drawn on layer at rotation rot."""
+        color = "#FFFF00" if highlight else self._layer_colors[layer]
         if p.shape != 'round' and p.dx > 0 and p.dy > 0:
-            hw = p.dx * self.scale / 2
-            hh = p.dy * self.scale / 2
-            points = [
-                (hw * math.cos(angle) - hh * math.sin(angle), hw * math.sin(angle) + hh * math.cos(angle)),
-                (hw * math.cos(angle) + hh * math.sin(angle), hw * math.sin(angle) - hh * math.cos(angle)),
-                (-hw * math.cos(angle) + hh * math.sin(angle), -hw * math.sin(angle) - hh * math.cos(angle)),
-                (-hw * math.cos(angle) - hh * math.sin(angle), -hw * math.sin(angle) + hh * math.cos(angle)),
-            ]
+            scale = self.scale
             screen_points = []
-            for px, py in points:
-                screen_points.append(sx + px)
-                screen_points.append(sy + py)
+            for px, py in _footprint_corners(p.dx, p.dy, rot):
+                screen_points.append(sx + px * scale)
+                screen_points.append(sy + py * scale)
             self.canvas.create_polygon(screen_points, outline=color, width=1, fill='')
         else:
             r = max(p.diameter, 0.1) * self.scale / 2
             self.canvas.create_oval(sx - r, sy - r, sx + r, sy + r, outline=color, width=1, fill='')
         if p.drill > 0:
-            dr = max(1, int(p.drill * self.scale / 2))
+            dr = int(p.drill * self.scale / 2) or 1
             self.canvas.create_oval(sx - dr, sy - dr, sx + dr, sy + dr, fill='white', outline='')
 
     def _draw_smd(self, s: SMD, highlight: bool = False):
         sx, sy = self.world_to_screen(s.x, s.y)
-        color = "#FFFF00" if highlight else self._layer_color(s.layer)
-        angle = math.radians(s.rot)
-        hw = max(1, int(s.dx * self.scale / 2))
-        hh = max(1, int(s.dy * self.scale / 2))
-        points = [
-            (hw * math.cos(angle) - hh * math.sin(angle), hw * math.sin(angle) + hh * math.cos(angle)),
-            (hw * math.cos(angle) + hh * math.sin(angle), hw * math.sin(angle) - hh * math.cos(angle)),
-            (-hw * math.cos(angle) + hh * math.sin(angle), -hw * math.sin(angle) - hh * math.cos(angle)),
-            (-hw * math.cos(angle) - hh * math.sin(angle), -hw * math.sin(angle) + hh * math.cos(angle)),
-        ]
+        self._create_smd(sx, sy, s, s.layer, s.rot, highlight)
+
+    def _create_smd(self, sx: float, sy: float, s: SMD, layer: int, rot: float, highlight: bool):
+        """SMD s centred on screen point (sx, sy), drawn on layer at rotation rot."""
+        color = "#FFFF00" if highlight else self._layer_colors[layer]
+        hw = int(s.dx * self.scale / 2) or 1
+        hh = int(s.dy * self.scale / 2) or 1
         screen_points = []
-        for px, py in points:
+        for px, py in _box_corners(hw, hh, *_sincos(rot)):
             screen_points.append(sx + px)
             screen_points.append(sy + py)
         self.canvas.create_polygon(screen_points, outline=color, width=1, fill=color)
@@ -1312,20 +1872,30 @@ class BRDViewer(tk.Tk):
         self.canvas.create_oval(sx - 1, sy - 1, sx + 1, sy + 1, fill="#FFFFFF", outline="")
 
     def _draw_polygon(self, p: Polygon, highlight: bool = False):
+        scale = self.scale
+        ox = self.offset_x
+        oy = self.offset_y
         points = []
         for vx, vy in p.vertices:
-            sx, sy = self.world_to_screen(vx, vy)
-            points.append(sx)
-            points.append(sy)
-        color = "#FFFF00" if p.is_outline or highlight else self._layer_color(p.layer)
+            points.append(ox + vx * scale)
+            points.append(oy - vy * scale)
+        self._create_polygon(points, p, p.layer, highlight)
+
+    def _create_polygon(self, points: List[float], p: Polygon, layer: int, highlight: bool):
+        """Canvas polygon through flat screen points, styled from p as drawn on layer."""
+        if p.is_outline or highlight:
+            color = "#FFFF00"
+            fill = self._lighten_color(color) if p.fill else ''
+        else:
+            color = self._layer_colors[layer]
+            fill = self._layer_fills[layer] if p.fill else ''
         width = max(2 if p.is_outline else 1, int(p.width * self.scale)) + (2 if highlight else 0)
-        fill = self._lighten_color(color) if p.fill else ''
         self.canvas.create_polygon(points, outline=color, width=width, fill=fill)
 
     def _draw_text(self, t: Text):
         sx, sy = self.world_to_screen(t.x, t.y)
-        color = self._layer_color(t.layer)
-        font_size = max(1, int(t.size * self.scale))
+        color = self._layer_colors[t.layer]
+        font_size = int(t.size * self.scale) or 1
         self.canvas.create_text(sx, sy, text=t.text, fill=color, anchor='center', font=("Segoe UI", font_size))
 
     def _draw_element_marker(self, e: Element):
@@ -1337,14 +1907,14 @@ class BRDViewer(tk.Tk):
 
     def _draw_circle(self, c: Circle, highlight: bool = False):
         sx, sy = self.world_to_screen(c.x, c.y)
-        color = "#FFFF00" if highlight else self._layer_color(c.layer)
+        color = "#FFFF00" if highlight else self._layer_colors[c.layer]
         r = c.radius * self.scale
-        width = max(1, int(c.width * self.scale)) + (2 if highlight else 0)
+        width = (int(c.width * self.scale) or 1) + (2 if highlight else 0)
         self.canvas.create_oval(sx - r, sy - r, sx + r, sy + r, outline=color, width=width)
 
     def _draw_rect(self, r: Rect, highlight: bool = False):
-        color = "#FFFF00" if highlight else self._layer_color(r.layer)
-        angle = math.radians(r.rot)
+        color = "#FFFF00" if highlight else self._layer_colors[r.layer]
+        sin_a, cos_a = _sincos(r.rot)
         x_min = min(r.x1, r.x2)
         x_max = max(r.x1, r.x2)
         y_min = min(r.y1, r.y2)
@@ -1353,143 +1923,120 @@ class BRDViewer(tk.Tk):
         cy = (y_min + y_max) / 2
         hw = (x_max - x_min) / 2 * self.scale
         hh = (y_max - y_min) / 2 * self.scale
-        points = [
-            (hw * math.cos(angle) - hh * math.sin(angle), hw * math.sin(angle) + hh * math.cos(angle)),
-            (hw * math.cos(angle) + hh * math.sin(angle), hw * math.sin(angle) - hh * math.cos(angle)),
-            (-hw * math.cos(angle) + hh * math.sin(angle), -hw * math.sin(angle) - hh * math.cos(angle)),
-            (-hw * math.cos(angle) - hh * math.sin(angle), -hw * math.sin(angle) + hh * math.cos(angle)),
-        ]
         sx, sy = self.world_to_screen(cx, cy)
         screen_points = []
-        for px, py in points:
+        for px, py in _box_corners(hw, hh, sin_a, cos_a):
             screen_points.append(sx + px)
             screen_points.append(sy + py)
         self.canvas.create_polygon(screen_points, fill=color, outline='', width=0)
 
-    def _draw_element_shapes(self, e: Element, visible_layers, highlight: bool = False):
-        package_shapes = self.board.packages.get(e.package, [])
-        angle = math.radians(self._parse_rot(e.rot))
-        mirror = 'M' in e.rot
-        for shape in package_shapes:
+    def _package_geometry(self, package: str, rot: str) -> list:
+        """Package shapes mirrored and rotated for an element rotation, relative to
+        the element origin; cached per (package, rot) so elements sharing both
+        only need translating."""
+        key = (package, rot)
+        geom = self._package_geoms.get(key)
+        if geom is not None:
+            return geom
+        elem_rot = _parse_rot(rot)
+        sin_a, cos_a = _sincos(elem_rot)
+        mirror = 'M' in rot
+        shape_rot_offset = elem_rot if not mirror else -elem_rot
+        # Mirror (x -> -x) followed by the rotation, folded into one 2x2 matrix
+        m = -1.0 if mirror else 1.0
+        m00, m01, m10, m11 = m * cos_a, -sin_a, m * sin_a, cos_a
+        geom = []
+        for shape in self.board.packages.get(package, []):
+            shape_layer = self._flip_layer(shape.layer) if mirror else shape.layer
             if isinstance(shape, Wire):
-                rx1 = shape.x1 if not mirror else -shape.x1
-                ry1 = shape.y1
-                rx1_rot = rx1 * math.cos(angle) - ry1 * math.sin(angle)
-                ry1_rot = rx1 * math.sin(angle) + ry1 * math.cos(angle)
-                abs_x1 = e.x + rx1_rot
-                abs_y1 = e.y + ry1_rot
-
-                rx2 = shape.x2 if not mirror else -shape.x2
-                ry2 = shape.y2
-                rx2_rot = rx2 * math.cos(angle) - ry2 * math.sin(angle)
-                ry2_rot = rx2 * math.sin(angle) + ry2 * math.cos(angle)
-                abs_x2 = e.x + rx2_rot
-                abs_y2 = e.y + ry2_rot
-
-                w_transformed = Wire(x1=abs_x1, y1=abs_y1, x2=abs_x2, y2=abs_y2, width=shape.width, layer=self._flip_layer(shape.layer) if mirror else shape.layer)
-                if w_transformed.layer in visible_layers:
-                    self._draw_wire(w_transformed, highlight=highlight)
-            elif isinstance(shape, Circle):
-                rx = shape.x if not mirror else -shape.x
-                ry = shape.y
-                rx_rot = rx * math.cos(angle) - ry * math.sin(angle)
-                ry_rot = rx * math.sin(angle) + ry * math.cos(angle)
-                abs_x = e.x + rx_rot
-                abs_y = e.y + ry_rot
-                shape_layer = self._flip_layer(shape.layer) if mirror else shape.layer
-                if shape_layer in visible_layers:
-                    self._draw_circle(Circle(abs_x, abs_y, shape.radius, shape.width, shape_layer), highlight=highlight)
+                x1, y1, x2, y2 = shape.x1, shape.y1, shape.x2, shape.y2
+                geom.append((shape_layer, shape, (m00 * x1 + m01 * y1, m10 * x1 + m11 * y1,
+                                                  m00 * x2 + m01 * y2, m10 * x2 + m11 * y2)))
             elif isinstance(shape, Rect):
                 x1 = shape.x1 if not mirror else -shape.x1
-                y1 = shape.y1
                 x2 = shape.x2 if not mirror else -shape.x2
-                y2 = shape.y2
                 x_min = min(x1, x2)
                 x_max = max(x1, x2)
-                y_min = min(y1, y2)
-                y_max = max(y1, y2)
+                y_min = min(shape.y1, shape.y2)
+                y_max = max(shape.y1, shape.y2)
                 cx = (x_min + x_max) / 2
                 cy = (y_min + y_max) / 2
-                cx_rot = cx * math.cos(angle) - cy * math.sin(angle)
-                cy_rot = cx * math.sin(angle) + cy * math.cos(angle)
-                abs_cx = e.x + cx_rot
-                abs_cy = e.y + cy_rot
-                shape_rot = shape.rot + (self._parse_rot(e.rot) if not mirror else -self._parse_rot(e.rot))
-                shape_layer = self._flip_layer(shape.layer) if mirror else shape.layer
-                if shape_layer in visible_layers:
-                    points_rel = [
-                        (x_min - cx, y_min - cy),
-                        (x_min - cx, y_max - cy),
-                        (x_max - cx, y_min - cy),
-                        (x_max - cx, y_max - cy),
-                    ]
-                    points_rot = []
-                    for px, py in points_rel:
-                        pxr = px * math.cos(angle) - py * math.sin(angle)
-                        pyr = px * math.sin(angle) + py * math.cos(angle)
-                        abs_x = e.x + pxr
-                        abs_y = e.y + pyr
-                        points_rot.append((abs_x, abs_y))
-                    screen_points = []
-                    for abs_x, abs_y in points_rot:
-                        sx, sy = self.world_to_screen(abs_x, abs_y)
-                        screen_points.append(sx)
-                        screen_points.append(sy)
-                    color = "#FFFF00" if highlight else self._layer_color(shape_layer)
-                    self.canvas.create_polygon(screen_points, fill=color, outline='', width=0)
+                points_rel = [
+                    (x_min - cx, y_min - cy),
+                    (x_min - cx, y_max - cy),
+                    (x_max - cx, y_min - cy),
+                    (x_max - cx, y_max - cy),
+                ]
+                geom.append((shape_layer, shape, [(px * cos_a - py * sin_a, px * sin_a + py * cos_a) for px, py in points_rel]))
             elif isinstance(shape, Polygon):
-                verts_transformed = []
-                for vx, vy in shape.vertices:
-                    rx = vx if not mirror else -vx
-                    ry = vy
-                    rx_rot = rx * math.cos(angle) - ry * math.sin(angle)
-                    ry_rot = rx * math.sin(angle) + ry * math.cos(angle)
-                    abs_x = e.x + rx_rot
-                    abs_y = e.y + ry_rot
-                    verts_transformed.append((abs_x, abs_y))
-                shape_layer = self._flip_layer(shape.layer) if mirror else shape.layer
-                if shape_layer in visible_layers:
-                    p_transformed = Polygon(vertices=verts_transformed, layer=shape_layer, width=shape.width, net=shape.net, fill=shape.fill, is_outline=shape.is_outline)
-                    self._draw_polygon(p_transformed, highlight=highlight)
+                verts = [(m00 * vx + m01 * vy, m10 * vx + m11 * vy) for vx, vy in shape.vertices]
+                geom.append((shape_layer, shape, verts))
             else:
-                rx = shape.x if not mirror else -shape.x
-                ry = shape.y
-                rx_rot = rx * math.cos(angle) - ry * math.sin(angle)
-                ry_rot = rx * math.sin(angle) + ry * math.cos(angle)
-                abs_x = e.x + rx_rot
-                abs_y = e.y + ry_rot
-                shape_rot = shape.rot + (self._parse_rot(e.rot) if not mirror else -self._parse_rot(e.rot))
-                shape_layer = self._flip_layer(shape.layer) if mirror else shape.layer
-                if shape_layer not in visible_layers:
-                    continue
-                if isinstance(shape, Pad):
-                    p_transformed = Pad(name=shape.name, x=abs_x, y=abs_y, drill=shape.drill, diameter=shape.diameter, dx=shape.dx, dy=shape.dy, shape=shape.shape, layer=shape_layer, rot=shape_rot)
-                    self._draw_pad(p_transformed, highlight=highlight)
-                elif isinstance(shape, SMD):
-                    s_transformed = SMD(name=shape.name, x=abs_x, y=abs_y, dx=shape.dx, dy=shape.dy, layer=shape_layer, roundness=shape.roundness, rot=shape_rot)
-                    self._draw_smd(s_transformed, highlight=highlight)
-
-    def _parse_rot(self, rot_str: str) -> float:
-        if not rot_str:
-            return 0.0
-        mirror = rot_str[0] == 'M'
-        rot_str = rot_str.lstrip('M')
-        rot = float(rot_str.lstrip('R')) if rot_str else 0.0
-        if mirror:
-            rot = -rot
-        return rot
+                # Circle, Pad and SMD: a rotated centre (plus the combined rotation)
+                x, y = shape.x, shape.y
+                shape_rot = shape.rot + shape_rot_offset if not isinstance(shape, Circle) else 0.0
+                geom.append((shape_layer, shape, (m00 * x + m01 * y, m10 * x + m11 * y, shape_rot)))
+        self._package_geoms[key] = geom
+        return geom
+
+    def _draw_element_shapes(self, e: Element, visible: List[bool], highlight: bool = False):
+        ex = e.x
+        ey = e.y
+        # The cached geometry is already rotated, so line work only needs the
+        # element origin in screen space plus each offset times the scale.
+        scale = self.scale
+        sx0, sy0 = self.world_to_screen(ex, ey)
+        colors = self._layer_colors
+        for shape_layer, shape, g in self._package_geometry(e.package, e.rot):
+            # Visibility only depends on the (possibly flipped) layer, so hidden
+            # shapes are skipped before any coordinate work.
+            if not visible[shape_layer]:
+                continue
+            if isinstance(shape, Wire):
+                color = "#FFFF00" if highlight else colors[shape_layer]
+                width = (int(shape.width * scale) or 1) + (2 if highlight else 0)
+                self.canvas.create_line(sx0 + g[0] * scale, sy0 - g[1] * scale, sx0 + g[2] * scale, sy0 - g[3] * scale,
+                                        fill=color, width=width)
+            elif isinstance(shape, Circle):
+                self._draw_circle(Circle(ex + g[0], ey + g[1], shape.radius, shape.width, shape_layer), highlight=highlight)
+            elif isinstance(shape, Rect):
+                screen_points = []
+                for pxr, pyr in g:
+                    screen_points.append(sx0 + pxr * scale)
+                    screen_points.append(sy0 - pyr * scale)
+                color = "#FFFF00" if highlight else colors[shape_layer]
+                self.canvas.create_polygon(screen_points, fill=color, outline='', width=0)
+            elif isinstance(shape, Polygon):
+                screen_points = []
+                for rx, ry in g:
+                    screen_points.append(sx0 + rx * scale)
+                    screen_points.append(sy0 - ry * scale)
+                self._create_polygon(screen_points, shape, shape_layer, highlight)
+            elif isinstance(shape, Pad):
+                self._create_pad(sx0 + g[0] * scale, sy0 - g[1] * scale, shape, shape_layer, g[2], highlight)
+            elif isinstance(shape, SMD):
+                self._create_smd(sx0 + g[0] * scale, sy0 - g[1] * scale, shape, shape_layer, g[2], highlight)
 
     def _flip_layer(self, layer: int) -> int:
-        flip_map = {
-            1: 16, 16: 1,
-            21: 22, 22: 21,
-            25: 26, 26: 25,
-            29: 30, 30: 29,
-        }
-        return flip_map.get(layer, layer)
+        return _FLIP_LAYER.get(layer, layer)
+
+    def _schedule_redraw(self):
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_pending = False
+        self.redraw()
 
     def _on_mouse_move(self, event):
-        xw, yw = self.screen_to_world(event.x, event.y)
+        self._pointer = (event.x, event.y)
+        if self._status_after is None:
+            self._status_after = self.after(_STATUS_INTERVAL_MS, self._show_pointer)
+
+    def _show_pointer(self):
+        self._status_after = None
+        xw, yw = self.screen_to_world(*self._pointer)
         self.status_lbl.config(text=f"x={xw:.3f}, y={yw:.3f}")
 
     def _on_left_down(self, event):
@@ -1500,43 +2047,71 @@ class BRDViewer(tk.Tk):
                 self.measure_points = self.measure_points[-2:]
             self.redraw()
         else:
-            self._drag_start = (event.x, event.y, self.offset_x, self.offset_y)
+            self._drag_anchor = (event.x - self.offset_x, event.y - self.offset_y)
 
     def _on_left_drag(self, event):
-        if self._drag_start is None:
+        if self._drag_anchor is None:
             return
-        sx0, sy0, ox0, oy0 = self._drag_start
-        dx = event.x - sx0
-        dy = event.y - sy0
-        self.offset_x = ox0 + dx
-        self.offset_y = oy0 + dy
-        self.redraw()
+        ax, ay = self._drag_anchor
+        self.offset_x = event.x - ax
+        self.offset_y = event.y - ay
+        self._schedule_redraw()
 
     def _on_mid_down(self, event):
-        self._drag_start = (event.x, event.y, self.offset_x, self.offset_y)
+        self._drag_anchor = (event.x - self.offset_x, event.y - self.offset_y)
 
     def _on_mid_drag(self, event):
-        if self._drag_start is None:
+        if self._drag_anchor is None:
             return
-        sx0, sy0, ox0, oy0 = self._drag_start
-        dx = event.x - sx0
-        dy = event.y - sy0
-        self.offset_x = ox0 + dx
-        self.offset_y = oy0 + dy
-        self.redraw()
+        ax, ay = self._drag_anchor
+        self.offset_x = event.x - ax
+        self.offset_y = event.y - ay
+        self._schedule_redraw()
 
     def _on_mouse_wheel(self, event):
         if hasattr(event, 'delta') and event.delta:
             delta = event.delta
         else:
             delta = 120 if getattr(event, 'num', 0) == 4 else -120
-        factor = 1.0 + (0.1 if delta > 0 else -0.1)
-        xw_before, yw_before = self.screen_to_world(event.x, event.y)
+        # Steps that arrive before the loop goes idle are applied together
+        self._wheel_steps += 1 if delta > 0 else -1
+        self._wheel_at = (event.x, event.y)
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.after_idle(self._apply_wheel)
+
+    def _apply_wheel(self):
+        self._wheel_pending = False
+        steps = self._wheel_steps
+        self._wheel_steps = 0
+        if not steps:
+            return
+        x, y = self._wheel_at
+        factor = 1.1 ** steps if steps > 0 else 0.9 ** -steps
+        xw_before, yw_before = self.screen_to_world(x, y)
+        old_scale = self.scale
         self.scale = max(0.05, min(self.scale * factor, 200.0))
-        xw_after, yw_after = self.screen_to_world(event.x, event.y)
+        xw_after, yw_after = self.screen_to_world(x, y)
         self.offset_x += (xw_after - xw_before) * self.scale
         self.offset_y += (-yw_after + yw_before) * self.scale
         self._update_zoom_label()
+        if self._board_view is None and self._zoom_after is None:
+            self.redraw()
+            return
+        # The cursor stays on the same world point, so scaling the drawn items
+        # about it previews the new view; the real redraw waits for the wheel
+        # to settle. Line widths and text sizes catch up at that point.
+        f = self.scale / old_scale
+        self.canvas.scale('board', x, y, f, f)
+        self._board_view = None
+        self.canvas.delete('!board')
+        self._draw_overlays(self._visible_layer_table())
+        if self._zoom_after is not None:
+            self.after_cancel(self._zoom_after)
+        self._zoom_after = self.after(_ZOOM_SETTLE_MS, self._finish_zoom)
+
+    def _finish_zoom(self):
+        self._zoom_after = None
         self.redraw()
 
 # ------------------------------
@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import Brd_Viewer as bv
+
+
+def board_xml(plain: str = '', signals: str = '', signals_first: bool = False) -> str:
+    sections = [f'<plain>{plain}</plain>', '<libraries/><elements/>', f'<signals>{signals}</signals>']
+    if signals_first:
+        sections.reverse()
+    return ('<?xml version="1.0" encoding="utf-8"?>\n'
+            '<eagle version="9.6"><drawing><layers>'
+            '<layer number="1" name="Top" color="4" fill="1" visible="yes" active="yes"/>'
+            '<layer number="17" name="Pads" color="2" fill="1" visible="yes" active="yes"/>'
+            '</layers><board>' + ''.join(sections) + '</board></drawing></eagle>\n')
+
+
+class ParserTests(unittest.TestCase):
+    def parse(self, xml: str) -> bv.Board:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'board.brd')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(xml)
+            return bv.EagleParser(path).parse()
+
+    def test_wire_on_large_layer_number_loads(self):
+        board = self.parse(board_xml(signals=(
+            '<signal name="N1">'
+            '<wire x1="0" y1="0" x2="10" y2="0" width="0.2" layer="40000"/>'
+            '<wire x1="10" y1="0" x2="10" y2="10" width="0.2" layer="1"/>'
+            '</signal>')))
+        self.assertEqual([w.layer for w in board.wires], [40000, 1])
+        self.assertEqual(list(board.wire_cols.layer), [1, 40000])
+        self.assertEqual(board.wire_cols.spans[40000], (1, 2))
+
+    def test_shapes_keep_section_order_regardless_of_file_order(self):
+        board = self.parse(board_xml(
+            plain='<wire x1="0" y1="0" x2="1" y2="0" width="0.1" layer="1"/>',
+            signals='<signal name="N1"><wire x1="0" y1="1" x2="1" y2="1" width="0.1" layer="1"/></signal>',
+            signals_first=True))
+        self.assertEqual([w.kind for w in board.wires], ['plain', 'signal'])
+
+    def test_pad_drill_counts_towards_its_grid_box(self):
+        # A 640-unit board gives 10-unit grid cells; the copper-less hole at
+        # x=49.9 only reaches into the cell starting at x=50 through its drill.
+        board = self.parse(board_xml(plain=(
+            '<wire x1="0" y1="0" x2="640" y2="640" width="0" layer="1"/>'
+            '<pad name="H" x="49.9" y="45" drill="4" diameter="0"/>')))
+        grid = board.layer_grids['pads'][board.pads[0].layer]
+        self.assertEqual(grid.query(51, 44, 52, 46), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()